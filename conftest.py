@@ -7,6 +7,24 @@ from PySide6.QtWidgets import QApplication
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
+from src.models import document_cache
+
+@pytest.fixture(scope="session", autouse=True)
+def thumbnail_persist_dir(tmp_path_factory):
+    """Keep the persistent thumbnail database out of the real user cache.
+
+    Any test rendering at thumbnail zoom would otherwise write JPEGs
+    into ~/.cache/pdf-editor, growing it across runs and leaking state
+    between sessions. Session-scoped so it is applied before any
+    class- or session-scoped fixture opens a document.
+    """
+    patch = pytest.MonkeyPatch()
+    patch.setattr(
+        document_cache, "_PERSIST_DIR", str(tmp_path_factory.mktemp("thumbs"))
+    )
+    yield
+    patch.undo()
+
 @pytest.fixture(scope="session")
 def qapp():
     """Create QApplication instance for all tests."""
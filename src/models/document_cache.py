@@ -1,102 +1,336 @@
 """
 Cache implementation for PDF document resources like page images and thumbnails.
 """
+import hashlib
+import os
+import sqlite3
+import time
 from typing import Optional, Dict
 import fitz
 from collections import OrderedDict
 from threading import Lock
 
+# Default location of the persistent thumbnail database
+_PERSIST_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdf-editor")
+
 class DocumentCache:
     """
     Handles caching of document resources like page images and thumbnails.
-    Implements an LRU (Least Recently Used) cache with thread-safe operations.
+    Implements a segmented (2Q-style) LRU cache with thread-safe operations:
+    first-touch entries live in a small "probation" segment and are only
+    promoted to the larger "protected" segment on a second hit. A single
+    sequential sweep (e.g. a thumbnail prefetch over every page) therefore
+    only churns probation and cannot evict pages the user is actually
+    viewing.
     """
-    def __init__(self, max_size: int = 100):
+    # Only thumbnail buckets are ever persisted (add_page_image stores
+    # compressed bytes, and only thumbnails are cached as bytes), so disk
+    # probes above this zoom key can never hit and would cost a sqlite
+    # SELECT per miss on the display-render path. Mirrors
+    # PDFDocument.THUMBNAIL_ZOOM (0.35 -> bucket 35).
+    PERSIST_MAX_ZOOM_KEY = 35
+
+    _ZOOM_MASK = (1 << 20) - 1
+
+    __slots__ = (
+        'max_size', 'persist_dir', '_protected_size', '_probation',
+        '_protected', '_pages_index', '_cache_lock', '_doc_key', '_db'
+    )
+
+    def __init__(self, max_size: int = 100, persist_dir: Optional[str] = None):
         """
         Initialize the document cache.
-        
+
         Args:
             max_size: Maximum number of items to keep in cache
+            persist_dir: Directory for the on-disk thumbnail database.
+                Defaults to the user cache directory; resolved at call
+                time so tests can redirect _PERSIST_DIR.
         """
         self.max_size = max_size
-        self._page_cache: OrderedDict[tuple, fitz.Pixmap] = OrderedDict()
+        self.persist_dir = persist_dir if persist_dir is not None else _PERSIST_DIR
+        # Protected holds entries that have been hit at least twice; it is
+        # capped so probation always retains some room for new entries.
+        self._protected_size = max(1, (3 * max_size) // 4)
+        self._probation: OrderedDict[int, fitz.Pixmap] = OrderedDict()
+        self._protected: OrderedDict[int, fitz.Pixmap] = OrderedDict()
+        # Reverse index mapping page number -> packed keys currently cached
+        # for it, so page removal is O(removed) instead of a full key scan.
+        self._pages_index: Dict[int, set] = {}
         self._cache_lock = Lock()
-        
-    def get_page_image(self, page: fitz.Page, zoom: float = 1.0) -> Optional[fitz.Pixmap]:
+        # Persistent L2 layer for compressed thumbnails. Only active once a
+        # document key is set and only consulted lazily, so plain in-memory
+        # use never touches the filesystem.
+        self._doc_key: Optional[str] = None
+        self._db: Optional[sqlite3.Connection] = None
+
+    def set_document(self, filepath: str, mtime: float) -> None:
+        """
+        Reset the cache for a new document and namespace disk lookups to it.
+
+        The in-memory segments are cleared, while persisted thumbnails keyed
+        on (filepath, mtime) survive so reopening a document can skip
+        re-rendering its thumbnail strip. A changed mtime yields a new key,
+        which naturally invalidates stale entries.
+
+        Args:
+            filepath: Path of the loaded PDF file
+            mtime: Modification time of the file when it was loaded
+        """
+        with self._cache_lock:
+            self._probation.clear()
+            self._protected.clear()
+            self._pages_index.clear()
+            self._doc_key = hashlib.sha1(
+                f"{filepath}:{mtime}".encode()).hexdigest()
+
+    def _get_db(self) -> sqlite3.Connection:
+        """Open (or return) the persistent thumbnail database."""
+        if self._db is None:
+            os.makedirs(self.persist_dir, exist_ok=True)
+            self._db = sqlite3.connect(
+                os.path.join(self.persist_dir, "thumbs.sqlite"),
+                check_same_thread=False
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS thumbnails ("
+                "doc TEXT NOT NULL, key INTEGER NOT NULL, "
+                "data BLOB NOT NULL, created REAL NOT NULL, "
+                "PRIMARY KEY (doc, key))"
+            )
+        return self._db
+
+    @staticmethod
+    def _make_key(page_number: int, zoom_key: int) -> int:
+        """
+        Pack (page_number, zoom_key) into a single int cache key.
+
+        Both inputs are already integers, so packing is two int ops with no
+        float rounding or tuple allocation on the cache probe hot path. The
+        zoom bucket is computed once by the caller (see
+        PDFDocument.get_page_image).
+
+        Args:
+            page_number: The page number
+            zoom_key: The fixed-point zoom bucket (zoom * 100, rounded)
+
+        Returns:
+            The packed cache key
+        """
+        return (page_number << 20) | zoom_key
+
+    def _index_add(self, cache_key: int) -> None:
+        """Record a cached key in the page reverse index."""
+        self._pages_index.setdefault(cache_key >> 20, set()).add(cache_key)
+
+    def _index_discard(self, cache_key: int) -> None:
+        """Drop a key from the page reverse index."""
+        page_number = cache_key >> 20
+        keys = self._pages_index.get(page_number)
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self._pages_index[page_number]
+
+    def get_page_image(self, page_number: int, zoom_key: int = 100) -> Optional[fitz.Pixmap]:
         """
         Get a cached page image if available, otherwise return None.
-        
+
         Args:
-            page: The page to get the image for
-            zoom: The zoom factor for the page image
-            
+            page_number: The number of the page to get the image for
+            zoom_key: The fixed-point zoom bucket for the page image
+
         Returns:
             The cached Pixmap if available, otherwise None
         """
-        # Round zoom to 2 decimal places to prevent nearly identical cache entries
-        zoom = round(zoom, 2)
-        cache_key = (page.number, zoom)
-        
+        cache_key = self._make_key(page_number, zoom_key)
+
+        # Lock-free fast path: move_to_end and the lookup are single C-level
+        # dict operations, atomic under the GIL. Readers may observe slightly
+        # stale LRU order, which is acceptable for a cache. The lock is only
+        # needed for the compound read-modify-write sequences below.
+        try:
+            self._protected.move_to_end(cache_key)
+            return self._protected[cache_key]
+        except KeyError:
+            pass
+
         with self._cache_lock:
-            if cache_key in self._page_cache:
-                # Move to end to mark as recently used
-                self._page_cache.move_to_end(cache_key)
-                return self._page_cache[cache_key]
-        return None
-        
-    def add_page_image(self, page: fitz.Page, image: fitz.Pixmap, zoom: float = 1.0) -> None:
+            if cache_key not in self._probation:
+                # The persistent layer only ever holds thumbnail buckets;
+                # skip the disk probe for display-zoom keys
+                if (cache_key & self._ZOOM_MASK) > self.PERSIST_MAX_ZOOM_KEY:
+                    return None
+                return self._get_persisted(cache_key)
+            # Second hit: promote from probation to protected.
+            image = self._probation.pop(cache_key)
+            if len(self._protected) >= self._protected_size:
+                # Demote the least recently used protected entry back to
+                # probation instead of dropping it outright.
+                demoted_key, demoted_image = self._protected.popitem(last=False)
+                self._probation[demoted_key] = demoted_image
+            self._protected[cache_key] = image
+            return image
+
+    def _get_persisted(self, cache_key: int):
+        """
+        Look up a compressed thumbnail in the persistent layer.
+
+        Called with the cache lock held. A hit is re-inserted into probation
+        so subsequent probes stay in memory.
+        """
+        if self._doc_key is None:
+            return None
+        row = self._get_db().execute(
+            "SELECT data FROM thumbnails WHERE doc = ? AND key = ?",
+            (self._doc_key, cache_key)
+        ).fetchone()
+        if row is None:
+            return None
+        data = row[0]
+        self._probation[cache_key] = data
+        self._index_add(cache_key)
+        while len(self._probation) + len(self._protected) > self.max_size:
+            if self._probation:
+                evicted_key, _ = self._probation.popitem(last=False)
+            else:
+                evicted_key, _ = self._protected.popitem(last=False)
+            self._index_discard(evicted_key)
+        return data
+
+    def add_page_image(self, page_number: int, image: fitz.Pixmap, zoom_key: int = 100) -> None:
         """
         Add a page image to the cache.
-        
+
         Args:
-            page: The page the image is for
+            page_number: The number of the page the image is for
             image: The page image to cache
-            zoom: The zoom factor for the page image
+            zoom_key: The fixed-point zoom bucket for the page image
         """
-        # Round zoom to 2 decimal places to prevent nearly identical cache entries
-        zoom = round(zoom, 2)
-        cache_key = (page.number, zoom)
-        
+        cache_key = self._make_key(page_number, zoom_key)
+
         with self._cache_lock:
             # If already in cache, don't add again
-            if cache_key in self._page_cache:
+            if cache_key in self._probation or cache_key in self._protected:
                 return
-                
-            # If cache is full, remove oldest item
-            if len(self._page_cache) >= self.max_size:
-                self._page_cache.popitem(last=False)
-            
-            self._page_cache[cache_key] = image
-            
+
+            # New entries always enter probation
+            self._probation[cache_key] = image
+            self._index_add(cache_key)
+
+            # Compressed thumbnails also go to the persistent layer
+            if self._doc_key is not None and isinstance(image, bytes):
+                self._get_db().execute(
+                    "INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?, ?)",
+                    (self._doc_key, cache_key, image, time.time())
+                )
+                self._db.commit()
+
+            # If cache is full, evict first-touch entries before protected ones
+            while len(self._probation) + len(self._protected) > self.max_size:
+                if self._probation:
+                    evicted_key, _ = self._probation.popitem(last=False)
+                else:
+                    evicted_key, _ = self._protected.popitem(last=False)
+                self._index_discard(evicted_key)
+
+    def _detach_persistence(self) -> None:
+        """
+        Stop reading from and writing to the persistent layer.
+
+        Called (with the cache lock held) whenever pages are renumbered or
+        removed: the sqlite rows are keyed against the on-disk file, so
+        after an in-memory edit they would serve thumbnails of the wrong
+        pages. Dropping the document key disables both lookups and
+        inserts; the rows themselves stay valid for reopening the
+        unmodified file.
+        """
+        self._doc_key = None
+
     def clear(self) -> None:
         """Clear all cached items."""
         with self._cache_lock:
-            self._page_cache.clear()
-            
+            self._probation.clear()
+            self._protected.clear()
+            self._pages_index.clear()
+
     def remove_page(self, page_number: int) -> None:
         """
         Remove all cached items for a specific page.
-        
+
+        Called on page mutations, so the persistent layer is detached as
+        well: its rows describe the on-disk file, whose page numbering no
+        longer matches the edited document (see _detach_persistence).
+
         Args:
             page_number: The page number to remove items for
         """
         with self._cache_lock:
-            keys_to_remove = [k for k in self._page_cache.keys() 
-                            if k[0] == page_number]
-            for key in keys_to_remove:
-                del self._page_cache[key]
+            for key in self._pages_index.pop(page_number, ()):
+                self._probation.pop(key, None)
+                self._protected.pop(key, None)
+            self._detach_persistence()
+
+    def remove_pages(self, page_numbers: set) -> None:
+        """
+        Remove all cached items for a set of pages in a single pass.
+
+        The reverse index makes this O(number of removed entries), however
+        many pages are in the cache.
+
+        Args:
+            page_numbers: The page numbers to remove items for
+        """
+        with self._cache_lock:
+            for page_number in page_numbers:
+                for key in self._pages_index.pop(page_number, ()):
+                    self._probation.pop(key, None)
+                    self._protected.pop(key, None)
+            self._detach_persistence()
+
+    def remap(self, old_to_new: Dict[int, int]) -> None:
+        """
+        Re-key cached entries after pages have been renumbered.
+
+        A reorder (select, copy) shifts page numbers but leaves the page
+        content untouched, so the rendered images are still valid — they
+        just belong to new indices. Remapping keys is far cheaper than
+        dropping the cache and re-rendering everything. Entries whose old
+        page number is not in the map are discarded.
+
+        Args:
+            old_to_new: Mapping of old page numbers to new page numbers
+        """
+        def rebuild(segment: OrderedDict) -> OrderedDict:
+            rebuilt = OrderedDict()
+            for key, value in segment.items():
+                new_page = old_to_new.get(key >> 20)
+                if new_page is not None:
+                    rebuilt[(new_page << 20) | (key & self._ZOOM_MASK)] = value
+            return rebuilt
+
+        with self._cache_lock:
+            self._probation = rebuild(self._probation)
+            self._protected = rebuild(self._protected)
+            self._pages_index = {}
+            for segment in (self._probation, self._protected):
+                for key in segment:
+                    self._index_add(key)
+            self._detach_persistence()
 
     @property
     def cache_info(self) -> Dict:
         """
         Get information about the cache state.
-        
+
         Returns:
             A dictionary with cache statistics
         """
         with self._cache_lock:
             return {
-                "size": len(self._page_cache),
+                "size": len(self._probation) + len(self._protected),
                 "max_size": self.max_size,
-                "pages": sorted(list(set(k[0] for k in self._page_cache.keys())))
-            }
\ No newline at end of file
+                "pages": sorted(self._pages_index.keys())
+            }
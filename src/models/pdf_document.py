@@ -1,25 +1,62 @@
+import os
+from pathlib import Path
 import fitz  # PyMuPDF
 from .document_cache import DocumentCache
-from typing import List, Tuple, Union, Optional, Callable
-from functools import wraps
+from typing import Dict, Iterable, List, Tuple, Union, Optional
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Lock
 from .pdf_errors import (
     PDFError,
     PDFDocumentError,
     PDFPageError
 )
 
-def require_document(f: Callable):
-    """Decorator that checks if a document is loaded before executing a method.
-    
+def _render_page(filepath: str, page_number: int, zoom: float) -> Tuple[bytes, int, int, bool]:
+    """Render a single page in a worker process.
+
+    Each worker opens its own document, since a fitz.Document must not be
+    shared across processes. Returns the raw pixmap data so it can be
+    pickled back to the parent and reassembled there.
+
     Args:
-        f: The method to wrap
+        filepath: Path to the PDF file
+        page_number: The zero-based index of the page to render
+        zoom: The zoom factor
+
+    Returns:
+        Tuple of (samples, width, height, alpha) describing the pixmap.
     """
-    @wraps(f)
-    def wrapper(self, *args, **kwargs):
-        if not self.doc:
-            raise PDFDocumentError(f"Cannot {f.__name__}: No document loaded")
-        return f(self, *args, **kwargs)
-    return wrapper
+    with fitz.open(filepath) as doc:
+        page = doc.load_page(page_number)
+        pixmap = page.get_pixmap(
+            matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csRGB, alpha=False
+        )
+        return pixmap.samples, pixmap.width, pixmap.height, bool(pixmap.alpha)
+
+def _search_pages(filepath: str, text: str, start: int, end: int) -> Tuple[List[int], List[float]]:
+    """Search a range of pages for text in a worker process.
+
+    Like _render_page, each worker opens its own document. Hits are
+    returned as flat parallel lists (page numbers plus x0,y0,x1,y1
+    quadruples) so the result pickles compactly.
+
+    Args:
+        filepath: Path to the PDF file
+        text: The text to search for
+        start: First page of the range (inclusive)
+        end: Last page of the range (exclusive)
+
+    Returns:
+        Tuple of (page_numbers, flat_coordinates) for all hits in range.
+    """
+    page_numbers: List[int] = []
+    coordinates: List[float] = []
+    with fitz.open(filepath) as doc:
+        for page_number in range(start, end):
+            for rect in doc.load_page(page_number).search_for(text):
+                page_numbers.append(page_number)
+                coordinates.extend((rect.x0, rect.y0, rect.x1, rect.y1))
+    return page_numbers, coordinates
 
 class PDFDocument:
     """
@@ -30,13 +67,54 @@ class PDFDocument:
         filepath (str, optional): The path to the PDF file. If provided, the
             document is loaded immediately. Defaults to None.
     """
+    # Renders at or below this zoom are thumbnails and are cached as JPEG
+    # bytes instead of raw pixmaps (roughly 30-50x smaller), so the whole
+    # thumbnail strip of a large document fits in the cache.
+    THUMBNAIL_ZOOM = 0.35
+    # Shared pool of render workers, created on first use. Rendering in
+    # separate processes sidesteps both the GIL and PyMuPDF's lack of
+    # thread safety.
+    _render_pool: Optional[ProcessPoolExecutor] = None
+
+    # Fixed attribute layout: slot descriptors are cheaper than per-instance
+    # __dict__ lookups on the render hot path
+    __slots__ = (
+        'filepath', 'doc', '_cache', '_displaylists', '_doc_lock',
+        '_prefetch_executor', '_pdf_bytes', '_page_count', '_dirty'
+    )
+
     def __init__(self, filepath: str = None):
         self.filepath = filepath
         self.doc: fitz.Document = None
         self._cache = DocumentCache()
+        # Display lists are parsed page content retained C-side; rendering
+        # the same page at another zoom reuses them instead of re-running
+        # the PDF interpreter. Invalidated whenever pages shift.
+        self._displaylists: Dict[int, fitz.DisplayList] = {}
+        # PyMuPDF objects are not safe for concurrent use, so every method
+        # that touches self.doc — renders, queries, mutations and saves —
+        # serializes on this lock; prefetching runs on a single dedicated
+        # worker thread for the same reason.
+        self._doc_lock = Lock()
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._pdf_bytes: Optional[bytes] = None
+        # Cached count: doc.page_count crosses into C on every access and
+        # navigation/thumbnail code reads it constantly
+        self._page_count = 0
+        # True once the in-memory document has diverged from the file on
+        # disk; worker processes reopen the file, so they must not be used
+        # while this is set (see search_document / render_pages).
+        self._dirty = False
         if filepath:
             self.load(filepath)
 
+    @classmethod
+    def _get_render_pool(cls) -> ProcessPoolExecutor:
+        """Return the shared render pool, creating it on first use."""
+        if cls._render_pool is None:
+            cls._render_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return cls._render_pool
+
     def load(self, filepath: str) -> None:
         """
         Loads a PDF document from the specified file path.
@@ -48,9 +126,20 @@ class PDFDocument:
             PDFDocumentError: If the file cannot be opened.
         """
         try:
-            self.doc = fitz.open(filepath)
-            self._cache.clear()  # Clear cache on new document load
+            # Read the file once and open from the in-memory buffer: fitz
+            # keeps a pointer into the bytes rather than copying them, and
+            # subsequent page loads never touch the filesystem again. It
+            # also means an external change to the file cannot corrupt an
+            # open document mid-session.
+            self._pdf_bytes = Path(filepath).read_bytes()
+            self.doc = fitz.open(stream=self._pdf_bytes, filetype="pdf")
+            # Reset the in-memory cache and namespace persisted thumbnails
+            # to this file, so reopening it can reuse them
+            self._cache.set_document(filepath, os.path.getmtime(filepath))
+            self._displaylists.clear()
             self.filepath = filepath
+            self._page_count = self.doc.page_count
+            self._dirty = False
         except Exception as e:
             raise PDFDocumentError(f"Failed to open PDF document: {str(e)}")
 
@@ -78,15 +167,13 @@ class PDFDocument:
             raise PDFDocumentError("Cannot save: No document loaded.")
         
         try:
-            # If saving to the original file, we must use incremental save
-            if filepath == self.filepath:
-                self.doc.save(
-                    filepath,
-                    incremental=True,
-                    encryption=self.doc.is_encrypted
-                )
-            else:
-                # When saving to a new file, we can use the optimization parameters
+            # The document is opened from an in-memory buffer, so it holds
+            # no lock on the original file: a full (optimized) save works
+            # for the original path and new paths alike. Incremental saves
+            # are not possible for stream-opened documents anyway.
+            with self._doc_lock:
+                if self.doc is None:
+                    raise PDFDocumentError("Cannot save: No document loaded.")
                 self.doc.save(
                     filepath,
                     garbage=garbage,
@@ -95,6 +182,9 @@ class PDFDocument:
                     incremental=False,
                     encryption=self.doc.is_encrypted
                 )
+            if filepath == self.filepath:
+                # The source file now matches the in-memory document again
+                self._dirty = False
         except Exception as e:
             raise PDFError(f"Failed to save PDF: {str(e)}")
 
@@ -102,11 +192,18 @@ class PDFDocument:
         """
         Closes the PDF document and releases resources.
         """
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
         if self.doc:
-            self.doc.close()
-            self.doc = None
+            with self._doc_lock:
+                self.doc.close()
+                self.doc = None
+                self._displaylists.clear()
             self._cache.clear()  # Clear cache when closing
+            self._pdf_bytes = None  # Release the file buffer
             self.filepath = None
+            self._page_count = 0
             
     def __enter__(self):
         """
@@ -136,7 +233,7 @@ class PDFDocument:
         Returns:
             int: The number of pages.
         """
-        return self.doc.page_count if self.doc else 0
+        return self._page_count
 
     @property
     def metadata(self) -> dict:
@@ -147,7 +244,8 @@ class PDFDocument:
              dict: A dictionary containing the document's metadata.  Returns
                  an empty dictionary if no document is loaded.
         """
-        return self.doc.metadata if self.doc else {}
+        with self._doc_lock:
+            return self.doc.metadata if self.doc else {}
 
     @property
     def toc(self) -> List[List]:
@@ -158,9 +256,9 @@ class PDFDocument:
             list: The table of contents as a list of lists.  Each inner list
             represents a TOC entry. Returns an empty list if no document is loaded.
         """
-        return self.doc.get_toc() if self.doc else []
+        with self._doc_lock:
+            return self.doc.get_toc() if self.doc else []
     
-    @require_document
     def delete_page(self, page_number: int) -> None:
         """
         Deletes a page from the document.
@@ -172,13 +270,18 @@ class PDFDocument:
             PDFPageError: If the page number is out of range.
             PDFDocumentError: If no document is loaded.
         """
+        if self.doc is None:
+            raise PDFDocumentError("Cannot delete_page: No document loaded")
         if 0 <= page_number < self.doc.page_count:
-            self.doc.delete_page(page_number)
+            with self._doc_lock:
+                self.doc.delete_page(page_number)
+                self._page_count = self.doc.page_count
+                self._dirty = True
+                self._displaylists.clear()  # Page numbers shifted
             self._cache.remove_page(page_number)  # Remove from cache
         else:
             raise PDFPageError("Page number out of range.")
 
-    @require_document
     def delete_pages(self, from_page: int, to_page: int) -> None:
         """
         Deletes a range of pages from the document.
@@ -191,14 +294,19 @@ class PDFDocument:
             PDFPageError: If the page numbers are out of range.
             PDFDocumentError: If no document is loaded.
         """
+        if self.doc is None:
+            raise PDFDocumentError("Cannot delete_pages: No document loaded")
         if 0 <= from_page <= to_page < self.doc.page_count:
-            self.doc.delete_pages(from_page=from_page, to_page=to_page)
-            for page_num in range(from_page, to_page + 1):
-                self._cache.remove_page(page_num)  # Remove from cache
+            with self._doc_lock:
+                self.doc.delete_pages(from_page=from_page, to_page=to_page)
+                self._page_count = self.doc.page_count
+                self._dirty = True
+                self._displaylists.clear()  # Page numbers shifted
+            # Remove the whole range from the cache in one pass
+            self._cache.remove_pages(set(range(from_page, to_page + 1)))
         else:
             raise PDFPageError("Page numbers out of range.")
     
-    @require_document
     def move_page(self, from_page: int, to_page: int) -> None:
         """
         Moves a page within the document.
@@ -211,15 +319,19 @@ class PDFDocument:
             PDFPageError: If the page numbers are out of range.
             PDFDocumentError: If no document is loaded.
         """
+        if self.doc is None:
+            raise PDFDocumentError("Cannot move_page: No document loaded")
         if 0 <= from_page < self.doc.page_count and 0 <= to_page < self.doc.page_count:
-            self.doc.move_page(from_page, to_page)
+            with self._doc_lock:
+                self.doc.move_page(from_page, to_page)
+                self._dirty = True
+                self._displaylists.clear()  # Page numbers shifted
             # Clear affected pages from cache
             self._cache.remove_page(from_page)
             self._cache.remove_page(to_page)
         else:
             raise PDFPageError("Page number out of range.")
     
-    @require_document
     def copy_page(self, page_number: int, to_page: int = -1) -> None:
         """
         Copy a page within the document.
@@ -233,14 +345,26 @@ class PDFDocument:
             PDFPageError: If the page numbers are out of range.
             PDFDocumentError: If no document is loaded.
         """
+        if self.doc is None:
+            raise PDFDocumentError("Cannot copy_page: No document loaded")
         if 0 <= page_number < self.doc.page_count:
-            self.doc.copy_page(page_number, to_page)
-            # Clear cache as page numbers may have shifted
-            self._cache.clear()
+            with self._doc_lock:
+                page_count = self.doc.page_count
+                self.doc.copy_page(page_number, to_page)
+                self._page_count = self.doc.page_count
+                self._dirty = True
+                self._displaylists.clear()
+            # Pages at or after the insertion point shift by one; re-key
+            # their cached images instead of throwing everything away. The
+            # copy itself renders on demand.
+            insert_at = page_count if to_page == -1 else to_page
+            self._cache.remap({
+                old: old if old < insert_at else old + 1
+                for old in range(page_count)
+            })
         else:
             raise PDFPageError("Page number out of range.")
 
-    @require_document
     def select(self, page_list: List[int]) -> None:
         """
         Selects a subset of pages to keep in the document, removing all others.
@@ -253,13 +377,22 @@ class PDFDocument:
             PDFPageError: If any page number in the list is out of range.
             PDFDocumentError: If no document is loaded.
         """
-        if all(0 <= p < self.doc.page_count for p in page_list):
-            self.doc.select(page_list)
-            self._cache.clear()  # Clear cache as page order changed
+        if self.doc is None:
+            raise PDFDocumentError("Cannot select: No document loaded")
+        # min()/max() run the range check in C, one pass each, instead of
+        # an interpreted comparison per element of a large selection
+        if page_list and min(page_list) >= 0 and max(page_list) < self.doc.page_count:
+            with self._doc_lock:
+                self.doc.select(page_list)
+                self._page_count = self.doc.page_count
+                self._dirty = True
+                self._displaylists.clear()
+            # Kept pages keep their rendered images under their new indices;
+            # everything else is dropped
+            self._cache.remap({old: new for new, old in enumerate(page_list)})
         else:
             raise PDFPageError("Invalid page number(s) in selection list.")
 
-    @require_document
     def new_page(self, pno: int = -1, width: float = -1, height: float = -1) -> fitz.Page:
         """
         Creates a new page in the PDF.
@@ -276,12 +409,18 @@ class PDFDocument:
         Raises:
             PDFDocumentError: If no document is loaded.
         """
-        page = self.doc.new_page(pno=pno, width=width, height=height)
+        if self.doc is None:
+            raise PDFDocumentError("Cannot new_page: No document loaded")
+        with self._doc_lock:
+            page = self.doc.new_page(pno=pno, width=width, height=height)
+            self._page_count = self.doc.page_count
+            self._dirty = True
+            if page and pno >= 0:
+                self._displaylists.clear()  # Page numbers shifted
         if page and pno >= 0:
             self._cache.remove_page(pno)  # Clear cache for affected position
         return page
 
-    @require_document
     def get_page_image(self, page_number: int, zoom: float = 1.0) -> Optional[fitz.Pixmap]:
         """
         Gets a pixmap representation of a page for display.
@@ -297,22 +436,193 @@ class PDFDocument:
         Raises:
             PDFDocumentError: If no document is loaded.
         """
-        if 0 <= page_number < self.doc.page_count:
-            page = self.doc.load_page(page_number)
-            
-            # Check cache first
-            cached_image = self._cache.get_page_image(page, zoom)
-            if cached_image:
+        if self.doc is None:
+            raise PDFDocumentError("Cannot get_page_image: No document loaded")
+        # Range-check against the cached scalar: close() nulls self.doc
+        # under the lock, and workers must not dereference it unlocked
+        if 0 <= page_number < self._page_count:
+            # Quantize zoom to a fixed-point bucket once, so the cache works
+            # on pure ints (no float rounding per probe)
+            zoom_key = int(zoom * 100 + 0.5)
+            # Check cache before materializing a page object
+            cached_image = self._cache.get_page_image(page_number, zoom_key)
+            if cached_image is not None:
+                # Thumbnails are cached compressed; decode on the way out
+                if isinstance(cached_image, bytes):
+                    return fitz.Pixmap(cached_image)
                 return cached_image
-            
+
             # Generate and cache if not found
             matrix = fitz.Matrix(zoom, zoom)
-            pixmap = page.get_pixmap(matrix=matrix)
-            self._cache.add_page_image(page, pixmap, zoom)
+            # RGB without alpha: viewing needs no transparency, and dropping
+            # the alpha channel cuts pixmap memory and blit bandwidth by 25%
+            with self._doc_lock:
+                # Re-check: the document may have been closed between the
+                # unlocked guard above and acquiring the lock
+                if self.doc is None:
+                    raise PDFDocumentError(
+                        "Cannot get_page_image: No document loaded"
+                    )
+                pixmap = self._get_displaylist(page_number).get_pixmap(
+                    matrix=matrix, colorspace=fitz.csRGB, alpha=False
+                )
+            if zoom <= self.THUMBNAIL_ZOOM:
+                self._cache.add_page_image(
+                    page_number, pixmap.tobytes("jpeg", jpg_quality=60), zoom_key
+                )
+            else:
+                self._cache.add_page_image(page_number, pixmap, zoom_key)
             return pixmap
         return None
     
-    @require_document
+    def get_page_thumbnail(self, page_number: int, target_width: int = 120,
+                           target_height: int = 160) -> Optional[fitz.Pixmap]:
+        """
+        Render a page directly at thumbnail size.
+
+        The zoom is derived from the page rectangle so MuPDF rasterizes
+        only the pixels the thumbnail needs, instead of rendering larger
+        and scaling down afterwards.
+
+        Args:
+            page_number (int): The zero-based index of the page.
+            target_width (int): Maximum thumbnail width in pixels.
+            target_height (int): Maximum thumbnail height in pixels.
+
+        Returns:
+            Optional[fitz.Pixmap]: A Pixmap no larger than the target size,
+                or None if the page number is invalid.
+
+        Raises:
+            PDFDocumentError: If no document is loaded.
+        """
+        if self.doc is None:
+            raise PDFDocumentError("Cannot get_page_thumbnail: No document loaded")
+        if not (0 <= page_number < self._page_count):
+            return None
+        with self._doc_lock:
+            if self.doc is None:
+                raise PDFDocumentError(
+                    "Cannot get_page_thumbnail: No document loaded"
+                )
+            rect = self._get_displaylist(page_number).rect
+        zoom = min(target_width / rect.width, target_height / rect.height)
+        return self.get_page_image(page_number, zoom)
+
+    def _get_displaylist(self, page_number: int) -> fitz.DisplayList:
+        """
+        Returns the (cached) display list for a page.
+
+        Args:
+            page_number (int): The zero-based index of the page.
+
+        Returns:
+            fitz.DisplayList: The display list of the page.
+        """
+        displaylist = self._displaylists.get(page_number)
+        if displaylist is None:
+            displaylist = self.doc.load_page(page_number).get_displaylist()
+            self._displaylists[page_number] = displaylist
+        return displaylist
+
+    def render_pages(self, page_numbers: Iterable[int], zoom: float = 1.0) -> Dict[int, fitz.Pixmap]:
+        """
+        Renders several pages in parallel across the shared render pool.
+
+        Pages already in the cache are returned directly; the rest are
+        rasterized in worker processes (one fitz.Document per worker) and
+        reassembled and cached here.
+
+        Args:
+            page_numbers: Zero-based indices of the pages to render.
+            zoom (float): The zoom factor. Defaults to 1.0.
+
+        Returns:
+            Dict[int, fitz.Pixmap]: A mapping of page number to rendered pixmap.
+
+        Raises:
+            PDFPageError: If any page number is out of range.
+            PDFDocumentError: If no document is loaded.
+        """
+        if self.doc is None:
+            raise PDFDocumentError("Cannot render_pages: No document loaded")
+        results: Dict[int, fitz.Pixmap] = {}
+        pending = {}
+        zoom_key = int(zoom * 100 + 0.5)
+        for page_number in page_numbers:
+            if not 0 <= page_number < self._page_count:
+                raise PDFPageError("Page number out of range.")
+            cached = self._cache.get_page_image(page_number, zoom_key)
+            if cached is not None:
+                # Thumbnail buckets cache compressed bytes; decode so the
+                # Pixmap promise in the signature holds for every zoom
+                if isinstance(cached, bytes):
+                    cached = fitz.Pixmap(cached)
+                results[page_number] = cached
+            elif self._dirty:
+                # Workers reopen the file, which no longer matches the
+                # edited in-memory document; render (and cache) locally
+                results[page_number] = self.get_page_image(page_number, zoom)
+            else:
+                pool = self._get_render_pool()
+                pending[page_number] = pool.submit(
+                    _render_page, self.filepath, page_number, zoom
+                )
+        for page_number, future in pending.items():
+            samples, width, height, alpha = future.result()
+            pixmap = fitz.Pixmap(fitz.csRGB, width, height, samples, alpha)
+            self._cache.add_page_image(page_number, pixmap, zoom_key)
+            results[page_number] = pixmap
+        return results
+
+    def prefetch(self, center_page: int, radius: int = 3, zoom: float = 1.0) -> List[Future]:
+        """
+        Schedules background rendering of the pages around a center page.
+
+        Rendering the neighbors of the currently viewed page while the user
+        is still reading hides the rasterization latency behind scroll time:
+        by the time the next page comes into view it is already cached.
+        Work runs on a single dedicated worker thread, with document access
+        serialized against the main thread.
+
+        Args:
+            center_page (int): The zero-based index of the current page.
+            radius (int): How many pages before and after to prerender.
+            zoom (float): The zoom factor. Defaults to 1.0.
+
+        Returns:
+            List[Future]: The scheduled render futures (useful for tests
+                or callers that want to wait for completion).
+
+        Raises:
+            PDFDocumentError: If no document is loaded.
+        """
+        if self.doc is None:
+            raise PDFDocumentError("Cannot prefetch: No document loaded")
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        futures = []
+        zoom_key = int(zoom * 100 + 0.5)
+        for page_number in range(center_page - radius, center_page + radius + 1):
+            if not 0 <= page_number < self._page_count:
+                continue
+            if self._cache.get_page_image(page_number, zoom_key) is not None:
+                continue
+            futures.append(
+                self._prefetch_executor.submit(
+                    self._prefetch_one, page_number, zoom
+                )
+            )
+        return futures
+
+    def _prefetch_one(self, page_number: int, zoom: float) -> None:
+        """Render one page for the prefetcher, ignoring a closed document."""
+        try:
+            self.get_page_image(page_number, zoom)
+        except PDFDocumentError:
+            # The document was closed between scheduling and execution
+            pass
+
     def get_page_text(self, page_number: int, text_type: str = "text") -> Optional[str]:
         """
         Gets text from page.
@@ -329,12 +639,18 @@ class PDFDocument:
         Raises:
             PDFDocumentError: If no document is loaded.
         """
-        if 0 <= page_number < self.doc.page_count:
-            page = self.doc.load_page(page_number)
-            return page.get_text(text_type)
+        if self.doc is None:
+            raise PDFDocumentError("Cannot get_page_text: No document loaded")
+        if 0 <= page_number < self._page_count:
+            with self._doc_lock:
+                if self.doc is None:
+                    raise PDFDocumentError(
+                        "Cannot get_page_text: No document loaded"
+                    )
+                page = self.doc.load_page(page_number)
+                return page.get_text(text_type)
         return None
     
-    @require_document
     def search_page_for(self, page_number: int, text: str, quads: bool = False) -> List[Union[fitz.Rect, fitz.Quad]]:
         """
         Searches text on a page.
@@ -352,12 +668,82 @@ class PDFDocument:
         Raises:
             PDFDocumentError: If no document is loaded.
         """
-        if 0 <= page_number < self.doc.page_count:
-            page = self.doc.load_page(page_number)
-            return page.search_for(text, quads=quads)
+        if self.doc is None:
+            raise PDFDocumentError("Cannot search_page_for: No document loaded")
+        if 0 <= page_number < self._page_count:
+            with self._doc_lock:
+                if self.doc is None:
+                    raise PDFDocumentError(
+                        "Cannot search_page_for: No document loaded"
+                    )
+                page = self.doc.load_page(page_number)
+                return page.search_for(text, quads=quads)
         return []
 
-    @require_document
+    def search_document(self, text: str) -> Dict[str, List]:
+        """
+        Searches the whole document for text, sharding pages across the
+        shared render pool.
+
+        Each worker opens its own document (PyMuPDF holds the GIL during a
+        search, so threads would not help) and page ranges are split evenly
+        across processes. Results come back as a struct-of-arrays: parallel
+        lists instead of fitz.Rect objects, which is compact to pickle and
+        cheap to iterate when drawing highlights.
+
+        Args:
+            text: The text to search for.
+
+        Returns:
+            Dict[str, List]: Parallel lists "pages", "x0", "y0", "x1", "y1",
+                one entry per hit, ordered by page number.
+
+        Raises:
+            PDFDocumentError: If no document is loaded.
+        """
+        if self.doc is None:
+            raise PDFDocumentError("Cannot search_document: No document loaded")
+        results: Dict[str, List] = {
+            "pages": [], "x0": [], "y0": [], "x1": [], "y1": []
+        }
+        page_count = self._page_count
+        if page_count == 0:
+            return results
+        if self._dirty:
+            # In-memory edits have not been written back to disk, so
+            # worker processes reopening the file would search stale
+            # content; search the live document in-process instead.
+            with self._doc_lock:
+                if self.doc is None:
+                    raise PDFDocumentError(
+                        "Cannot search_document: No document loaded"
+                    )
+                for page_number in range(page_count):
+                    hits = self.doc.load_page(page_number).search_for(text)
+                    for rect in hits:
+                        results["pages"].append(page_number)
+                        results["x0"].append(rect.x0)
+                        results["y0"].append(rect.y0)
+                        results["x1"].append(rect.x1)
+                        results["y1"].append(rect.y1)
+            return results
+        workers = min(os.cpu_count() or 1, page_count)
+        chunk = -(-page_count // workers)  # ceil division
+        pool = self._get_render_pool()
+        futures = [
+            pool.submit(_search_pages, self.filepath, text,
+                        start, min(start + chunk, page_count))
+            for start in range(0, page_count, chunk)
+        ]
+        for future in futures:
+            page_numbers, coordinates = future.result()
+            results["pages"].extend(page_numbers)
+            results["x0"].extend(coordinates[0::4])
+            results["y0"].extend(coordinates[1::4])
+            results["x1"].extend(coordinates[2::4])
+            results["y1"].extend(coordinates[3::4])
+        return results
+
     def get_page_images(self, page_number: int) -> List[Tuple]:
         """
         Return a list of all images on a page.
@@ -372,12 +758,18 @@ class PDFDocument:
         Raises:
             PDFDocumentError: If no document is loaded.
         """
-        if 0 <= page_number < self.doc.page_count:
-            page = self.doc.load_page(page_number)
-            return page.get_images()
+        if self.doc is None:
+            raise PDFDocumentError("Cannot get_page_images: No document loaded")
+        if 0 <= page_number < self._page_count:
+            with self._doc_lock:
+                if self.doc is None:
+                    raise PDFDocumentError(
+                        "Cannot get_page_images: No document loaded"
+                    )
+                page = self.doc.load_page(page_number)
+                return page.get_images()
         return []
 
-    @require_document
     def extract_image(self, xref: int) -> dict:
         """
         Extracts an image from the PDF by its cross-reference number (xref).
@@ -391,4 +783,11 @@ class PDFDocument:
         Raises:
             PDFDocumentError: If no document is loaded.
         """
-        return self.doc.extract_image(xref) if self.doc else {}
\ No newline at end of file
+        if self.doc is None:
+            raise PDFDocumentError("Cannot extract_image: No document loaded")
+        with self._doc_lock:
+            if self.doc is None:
+                raise PDFDocumentError(
+                    "Cannot extract_image: No document loaded"
+                )
+            return self.doc.extract_image(xref)
\ No newline at end of file
@@ -1,9 +1,18 @@
+import os
+
 from PySide6.QtWidgets import (
     QMainWindow, QStatusBar, QFileDialog, QMessageBox,
     QSplitter, QWidget, QVBoxLayout
 )
-from PySide6.QtCore import Qt, QSize, QSettings
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QImage, QPixmap, QKeySequence, QShortcut
+from collections import OrderedDict, deque
+
+from PySide6.QtCore import (
+    Qt, QSize, QSettings, QTimer, QThreadPool, QRunnable, QObject, Signal
+)
+from PySide6.QtGui import (
+    QDragEnterEvent, QDropEvent, QImage, QPixmap, QPixmapCache,
+    QKeySequence, QShortcut
+)
 
 from src.views.toolbar import PDFToolBar
 from src.views.menu_bar import PDFMenuBar
@@ -11,14 +20,135 @@ from src.views.pdf_viewer import PDFViewerWidget
 from src.views.thumbnail_panel import PDFThumbnailPanel
 from src.models.pdf_document import PDFDocument, PDFError
 
+def pixmap_to_qimage(pixmap) -> QImage:
+    """Wrap a fitz pixmap's sample buffer in a QImage without copying.
+
+    Using the memoryview avoids the full-buffer copy that .samples makes.
+    The pixmap is stashed on the image to keep the underlying buffer alive
+    for as long as the QImage is in use.
+
+    Args:
+        pixmap: The fitz.Pixmap to wrap
+
+    Returns:
+        QImage: An RGB888 image viewing the pixmap's buffer
+    """
+    img = QImage(
+        pixmap.samples_mv,
+        pixmap.width,
+        pixmap.height,
+        pixmap.stride,
+        QImage.Format_RGB888
+    )
+    img._mupdf_pixmap = pixmap
+    return img
+
+class RenderSignals(QObject):
+    """Signal holder for render tasks (QRunnable cannot carry signals)."""
+
+    # (page, zoom, fitz pixmap) — the QImage is built on the GUI thread
+    pageRendered = Signal(int, float, object)
+
+class PageRenderTask(QRunnable):
+    """Renders one page off the GUI thread and reports back via signal.
+
+    Thumbnail renders are also smooth-scaled to icon size on the worker
+    (QImage operations are thread-safe), so the GUI thread only converts
+    the finished image to a QPixmap.
+
+    Args:
+        pdf_document: The document to render from
+        page: The page number (0-based)
+        zoom: The zoom factor to render at
+        signals: Shared RenderSignals instance to emit the result on
+    """
+
+    def __init__(self, pdf_document, page: int, zoom: float, signals: RenderSignals):
+        super().__init__()
+        self.pdf_document = pdf_document
+        self.page = page
+        self.zoom = zoom
+        self.signals = signals
+
+    def run(self):
+        try:
+            if self.zoom == MainWindow.THUMBNAIL_ZOOM:
+                pixmap = self.pdf_document.get_page_thumbnail(self.page)
+            else:
+                pixmap = self.pdf_document.get_page_image(self.page, self.zoom)
+        except PDFError:
+            return  # Document was closed while the task was queued
+        if pixmap is None:
+            return
+        if self.zoom == MainWindow.THUMBNAIL_ZOOM:
+            # Rendered at target size already; just wrap for the GUI thread
+            result = pixmap_to_qimage(pixmap)
+        else:
+            result = pixmap
+        self.signals.pageRendered.emit(self.page, self.zoom, result)
+
 class MainWindow(QMainWindow):
     """Main window of the PDF Editor application."""
+
+    # Cap on full-resolution pages kept in the viewer: memory stays
+    # O(cap) instead of O(page_count) on large documents
+    MAX_LOADED_PAGES = 64
+    # Sentinel zoom tagging thumbnail-strip renders in the in-flight and
+    # pixmap-cache bookkeeping; the actual render scale is derived from
+    # the page size by get_page_thumbnail
+    THUMBNAIL_ZOOM = 0.2
     
     def __init__(self):
         super().__init__()
         self.pdf_document = None
-        self.loaded_pages = set()  # Track which pages have been loaded
+        # LRU of loaded page numbers (insertion order = recency)
+        self.loaded_pages = OrderedDict()
         self.settings = QSettings('MaximilianDev', 'PDF-Editor')
+        # Settings are read/written through an in-memory cache; only keys
+        # that actually changed hit QSettings (registry/ini I/O) on save
+        self._settings_cache = {}
+        self._settings_dirty = set()
+        # Rendering happens on background workers so the event loop stays
+        # responsive; results arrive via a queued signal on the GUI thread
+        self.render_pool = QThreadPool(self)
+        self.render_pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) - 1))
+        self.render_signals = RenderSignals()
+        self.render_signals.pageRendered.connect(self.on_page_rendered)
+        self.pages_in_flight = set()  # (page, zoom) pairs queued or running
+        # Shared bounded cache for converted pixmaps; keys embed a document
+        # generation so stale entries die naturally on document switch
+        QPixmapCache.setCacheLimit(64 * 1024)  # 64 MB
+        self._doc_generation = 0
+        self._pending_drop_path = None
+        self._status_prefix = ""
+        # Thumbnails render lazily: visible placeholders are queued and
+        # processed one per event-loop tick, so opening a large document
+        # only rasterizes the pages actually on screen
+        self.thumbnail_queue = deque()
+        self.thumbnail_timer = QTimer(self)
+        self.thumbnail_timer.setInterval(0)
+        self.thumbnail_timer.timeout.connect(self.process_thumbnail_queue)
+        # Debounce scroll events so a fast flick queues one batch, not one
+        # per scrollbar tick
+        self.thumbnail_scroll_timer = QTimer(self)
+        self.thumbnail_scroll_timer.setSingleShot(True)
+        self.thumbnail_scroll_timer.setInterval(50)
+        self.thumbnail_scroll_timer.timeout.connect(self.enqueue_visible_thumbnails)
+        # Coalesce rapid page changes: a fast scroll only renders the pages
+        # around where the user lands, not every page flown past
+        self._pending_prefetch_page = 0
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(80)
+        self.prefetch_timer.timeout.connect(self._do_prefetch)
+        # Status-bar text is rebuilt at most once per ~frame during rapid
+        # page changes instead of per signal
+        self._pending_status_page = 0
+        self._last_toolbar_page = -1
+        self.status_throttle = QTimer(self)
+        self.status_throttle.setSingleShot(True)
+        self.status_throttle.setInterval(16)
+        self.status_throttle.timeout.connect(self._show_page_status)
         self.setup_ui()
         self.setup_connections()
         self.setup_shortcuts()
@@ -93,47 +223,100 @@ class MainWindow(QMainWindow):
         # Connect viewer signals
         self.pdf_viewer.zoomChanged.connect(self.on_zoom_changed)
         self.pdf_viewer.pageChanged.connect(self.on_page_changed)
+        self.pdf_viewer.pageReleased.connect(self.on_page_released)
+        self.pdf_viewer.rerenderRequested.connect(self.on_rerender_requested)
         
         # Connect thumbnail panel signals
         self.thumbnail_panel.pageSelected.connect(self.pdf_viewer.go_to_page)
+        scrollbar = self.thumbnail_panel.list_widget.verticalScrollBar()
+        # Drop the scrollbar value: QTimer.start(int) would otherwise
+        # treat it as a new interval and clobber the 50 ms debounce
+        scrollbar.valueChanged.connect(self._on_thumbnail_scrolled)
     
     def setup_shortcuts(self):
         """Set up keyboard shortcuts."""
         QShortcut(QKeySequence(Qt.ALT | Qt.Key_G), self,
                  self.toolbar.pageSpinBox.setFocus)
     
+    def _get_setting(self, key, default=None, value_type=None):
+        """Read a setting through the in-memory cache.
+
+        Args:
+            key: The settings key
+            default: Value to use when the key is not stored
+            value_type: Optional type for QSettings conversion
+
+        Returns:
+            The cached (or freshly read) setting value
+        """
+        if key not in self._settings_cache:
+            self.settings.beginGroup('mainwindow')
+            try:
+                if value_type is not None:
+                    value = self.settings.value(key, default, type=value_type)
+                else:
+                    value = self.settings.value(key, default)
+            finally:
+                self.settings.endGroup()
+            self._settings_cache[key] = value
+        return self._settings_cache[key]
+
+    def _set_setting(self, key, value):
+        """Update a setting in the cache, marking it dirty only on change.
+
+        Args:
+            key: The settings key
+            value: The new value
+        """
+        if key in self._settings_cache and self._settings_cache[key] == value:
+            return
+        self._settings_cache[key] = value
+        self._settings_dirty.add(key)
+
     def load_settings(self):
         """Load application settings."""
         # Load window geometry
-        geometry = self.settings.value('geometry')
+        geometry = self._get_setting('geometry')
         if geometry:
             self.restoreGeometry(geometry)
-            
+
         # Load toolbar visibility
-        toolbar_visible = self.settings.value('toolbar_visible', True, type=bool)
+        toolbar_visible = self._get_setting('toolbar_visible', True, value_type=bool)
         self.toolbar.setVisible(toolbar_visible)
-        
+
         # Load thumbnails visibility
-        thumbnails_visible = self.settings.value('thumbnails_visible', True, type=bool)
+        thumbnails_visible = self._get_setting('thumbnails_visible', True, value_type=bool)
         self.thumbnail_panel.setVisible(thumbnails_visible)
-        
+
         # Load splitter state
-        splitter_state = self.settings.value('splitter_state')
+        splitter_state = self._get_setting('splitter_state')
         if splitter_state:
             self.splitter.restoreState(splitter_state)
-        
+
         # Load recent files
-        recent_files = self.settings.value('recent_files', [], type=list)
+        recent_files = self._get_setting('recent_files', [], value_type=list)
         for filepath in recent_files:
             self.menu_bar.add_recent_file(filepath)
-    
+
     def save_settings(self):
-        """Save application settings."""
-        self.settings.setValue('geometry', self.saveGeometry())
-        self.settings.setValue('toolbar_visible', self.toolbar.isVisible())
-        self.settings.setValue('thumbnails_visible', self.thumbnail_panel.isVisible())
-        self.settings.setValue('splitter_state', self.splitter.saveState())
-        self.settings.setValue('recent_files', self.menu_bar.recent_files)
+        """Save application settings, writing only the keys that changed."""
+        self._set_setting('geometry', self.saveGeometry())
+        self._set_setting('toolbar_visible', self.toolbar.isVisible())
+        self._set_setting('thumbnails_visible', self.thumbnail_panel.isVisible())
+        self._set_setting('splitter_state', self.splitter.saveState())
+        self._set_setting('recent_files', list(self.menu_bar.recent_files))
+
+        if not self._settings_dirty:
+            return
+        # One grouped transaction, flushed with a single sync
+        self.settings.beginGroup('mainwindow')
+        try:
+            for key in self._settings_dirty:
+                self.settings.setValue(key, self._settings_cache[key])
+        finally:
+            self.settings.endGroup()
+        self._settings_dirty.clear()
+        self.settings.sync()
     
     def toggle_toolbar(self, visible: bool):
         """Toggle toolbar visibility.
@@ -169,18 +352,71 @@ class MainWindow(QMainWindow):
             page: New page number (0-based)
         """
         if self.pdf_document:
-            # Update toolbar page controls
-            self.toolbar.update_page_info(page, self.pdf_document.page_count)
-            
-            # Update status bar
-            self.status_bar.showMessage(
-                f"Page {page + 1}/{self.pdf_document.page_count} | "
-                f"File: {self.pdf_document.filepath}"
-            )
-            
-            # Load adjacent pages if not already loaded
-            self.load_page_range(max(0, page - 1), min(self.pdf_document.page_count, page + 2))
+            # Update toolbar page controls (skip if unchanged)
+            if page != self._last_toolbar_page:
+                self.toolbar.update_page_info(page, self.pdf_document.page_count)
+                self._last_toolbar_page = page
+
+            # Coalesce status-bar updates to one per throttle interval
+            self._pending_status_page = page
+            self.status_throttle.start()
+
+            # Load adjacent pages once the scroll position settles;
+            # restarting the timer drops superseded requests
+            self._pending_prefetch_page = page
+            self.prefetch_timer.start()
+
+    def _show_page_status(self):
+        """Write the throttled page/file message to the status bar."""
+        if not self.pdf_document:
+            return
+        page = self._pending_status_page
+        self.status_bar.showMessage(
+            f"Page {page + 1}/{self.pdf_document.page_count} | "
+            f"{self._status_prefix}"
+        )
+
+    def _do_prefetch(self):
+        """Load the pages around where the user stopped scrolling."""
+        if not self.pdf_document:
+            return
+        page = self._pending_prefetch_page
+        self.load_page_range(
+            max(0, page - 1), min(self.pdf_document.page_count, page + 2)
+        )
     
+    def _pixmap_cache_key(self, page: int, zoom: float) -> str:
+        """Build the QPixmapCache key for a page at a zoom level.
+
+        Args:
+            page: The page number (0-based)
+            zoom: The zoom factor
+
+        Returns:
+            str: The cache key, namespaced by document generation
+        """
+        return f"{self._doc_generation}:{page}:{zoom}"
+
+    def _mark_page_loaded(self, page: int):
+        """Record a page as resident in the viewer, evicting the LRU one.
+
+        Args:
+            page: The page number (0-based)
+        """
+        self.loaded_pages[page] = None
+        self.loaded_pages.move_to_end(page)
+        while len(self.loaded_pages) > self.MAX_LOADED_PAGES:
+            evicted, _ = self.loaded_pages.popitem(last=False)
+            self.pdf_viewer.unload_page(evicted)
+
+    def on_page_released(self, page: int):
+        """Forget a page the viewer dropped so it gets re-rendered on demand.
+
+        Args:
+            page: The released page number (0-based)
+        """
+        self.loaded_pages.pop(page, None)
+
     def load_page_range(self, start: int, end: int):
         """Load a range of pages.
 
@@ -189,21 +425,41 @@ class MainWindow(QMainWindow):
             end: End page number (exclusive)
         """
         for page in range(start, end):
-            if page not in self.loaded_pages:
-                pixmap = self.pdf_document.get_page_image(page)
-                if pixmap:
-                    # Convert PyMuPDF pixmap to Qt image
-                    img = QImage(
-                        pixmap.samples,
-                        pixmap.width,
-                        pixmap.height,
-                        pixmap.stride,
-                        QImage.Format_RGB888
-                    )
-                    # Add to viewer
-                    self.pdf_viewer.display_page(page, img)
-                    self.loaded_pages.add(page)
+            if page in self.loaded_pages:
+                self.loaded_pages.move_to_end(page)  # Refresh recency
+                continue
+            cached = QPixmap()
+            if QPixmapCache.find(self._pixmap_cache_key(page, 1.0), cached):
+                # Previously converted pixmap still in the shared cache
+                self.pdf_viewer.display_page(page, cached)
+                self._mark_page_loaded(page)
+            elif (page, 1.0) not in self.pages_in_flight:
+                self.pages_in_flight.add((page, 1.0))
+                self.render_pool.start(
+                    PageRenderTask(self.pdf_document, page, 1.0, self.render_signals)
+                )
     
+    def on_rerender_requested(self, page: int, zoom: float):
+        """Render a page at a higher zoom for sharper display.
+
+        Emitted by the viewer when the user zooms past the resolution of a
+        page's stored original.
+
+        Args:
+            page: The page number to re-render (0-based)
+            zoom: The zoom factor to render at
+        """
+        if not self.pdf_document:
+            return
+        cached = QPixmap()
+        if QPixmapCache.find(self._pixmap_cache_key(page, zoom), cached):
+            self.pdf_viewer.display_page(page, cached, render_zoom=zoom)
+        elif (page, zoom) not in self.pages_in_flight:
+            self.pages_in_flight.add((page, zoom))
+            self.render_pool.start(
+                PageRenderTask(self.pdf_document, page, zoom, self.render_signals)
+            )
+
     def open_document(self, filepath: str) -> bool:
         """Open a PDF document.
 
@@ -224,8 +480,14 @@ class MainWindow(QMainWindow):
             if self.pdf_document is None:
                 return False
 
-            # Clear loaded pages tracking
+            # Clear loaded pages tracking; bumping the generation retires
+            # all pixmap-cache entries of the previous document
             self.loaded_pages.clear()
+            self.pages_in_flight.clear()
+            self._doc_generation += 1
+            # Force the first page-change of the new document through the
+            # toolbar update, even if it lands on the same page number
+            self._last_toolbar_page = -1
 
             # Update UI
             self.toolbar.update_actions(True)
@@ -236,25 +498,20 @@ class MainWindow(QMainWindow):
 
             # Clear and reset thumbnail panel
             self.thumbnail_panel.clear()
+            self.thumbnail_queue.clear()
 
             self.load_page_range(0, min(3, self.pdf_document.page_count))
 
-            # Load remaining thumbnails in background
-            for page in range(0, self.pdf_document.page_count):  # Start from 0 to include all pages
-                pixmap = self.pdf_document.get_page_image(page, zoom=0.2)  # Small size for thumbnails
-                if pixmap:
-                    img = QImage(
-                        pixmap.samples,
-                        pixmap.width,
-                        pixmap.height,
-                        pixmap.stride,
-                        QImage.Format_RGB888
-                    )
-                    self.thumbnail_panel.add_thumbnail(QPixmap.fromImage(img), page)
+            # Placeholders for every page; only the visible ones render
+            self.thumbnail_panel.populate_placeholders(self.pdf_document.page_count)
+            self.enqueue_visible_thumbnails()
 
             # Add to recent files
             self.menu_bar.add_recent_file(filepath)
 
+            # Formatted once; page changes only prepend the page counter
+            self._status_prefix = f"File: {filepath}"
+
             return True
 
         except PDFError as e:
@@ -267,6 +524,66 @@ class MainWindow(QMainWindow):
             self.pdf_document = None
             return False
     
+    def _on_thumbnail_scrolled(self, _value: int):
+        """Restart the thumbnail scroll debounce without touching its interval.
+
+        Args:
+            _value: The scrollbar position (unused)
+        """
+        self.thumbnail_scroll_timer.start()
+
+    def enqueue_visible_thumbnails(self):
+        """Queue thumbnail renders for the placeholders currently on screen."""
+        if not self.pdf_document:
+            return
+        for page in self.thumbnail_panel.visible_placeholder_pages():
+            if page not in self.thumbnail_queue:
+                self.thumbnail_queue.append(page)
+        if self.thumbnail_queue:
+            self.thumbnail_timer.start()
+
+    def process_thumbnail_queue(self):
+        """Render one queued thumbnail per event-loop tick."""
+        if not self.thumbnail_queue or not self.pdf_document:
+            self.thumbnail_timer.stop()
+            return
+        page = self.thumbnail_queue.popleft()
+        cached = QPixmap()
+        if QPixmapCache.find(self._pixmap_cache_key(page, self.THUMBNAIL_ZOOM), cached):
+            self.thumbnail_panel.set_thumbnail(page, cached)
+        elif (page, self.THUMBNAIL_ZOOM) not in self.pages_in_flight:
+            self.pages_in_flight.add((page, self.THUMBNAIL_ZOOM))
+            self.render_pool.start(
+                PageRenderTask(self.pdf_document, page, self.THUMBNAIL_ZOOM,
+                               self.render_signals)
+            )
+        if not self.thumbnail_queue:
+            self.thumbnail_timer.stop()
+
+    def on_page_rendered(self, page: int, zoom: float, pixmap):
+        """Dispatch a background-rendered page to the right widget.
+
+        Runs on the GUI thread (queued connection), so the QImage and
+        QPixmap are constructed here rather than on the worker.
+
+        Args:
+            page: The rendered page number (0-based)
+            zoom: The zoom factor it was rendered at
+            pixmap: The fitz pixmap produced by the worker
+        """
+        self.pages_in_flight.discard((page, zoom))
+        if isinstance(pixmap, QImage):
+            # Thumbnails arrive pre-scaled from the worker
+            qt_pixmap = QPixmap.fromImage(pixmap)
+        else:
+            qt_pixmap = QPixmap.fromImage(pixmap_to_qimage(pixmap))
+        QPixmapCache.insert(self._pixmap_cache_key(page, zoom), qt_pixmap)
+        if zoom == self.THUMBNAIL_ZOOM:
+            self.thumbnail_panel.set_thumbnail(page, qt_pixmap)
+        else:
+            self.pdf_viewer.display_page(page, qt_pixmap, render_zoom=zoom)
+            self._mark_page_loaded(page)
+
     def update_status_bar(self):
         """Update the status bar with document information."""
         if self.pdf_document:
@@ -323,10 +640,15 @@ class MainWindow(QMainWindow):
         Args:
             event: The drag enter event
         """
+        self._pending_drop_path = None
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
-            if len(urls) == 1 and urls[0].toLocalFile().lower().endswith('.pdf'):
-                event.acceptProposedAction()
+            if len(urls) == 1:
+                filepath = urls[0].toLocalFile()
+                if filepath.lower().endswith('.pdf'):
+                    # Converted once here; dropEvent reuses the path
+                    self._pending_drop_path = filepath
+                    event.acceptProposedAction()
     
     def dropEvent(self, event: QDropEvent):
         """Handle drop events for PDF files.
@@ -334,10 +656,9 @@ class MainWindow(QMainWindow):
         Args:
             event: The drop event
         """
-        urls = event.mimeData().urls()
-        if urls:
-            filepath = urls[0].toLocalFile()
-            self.open_document(filepath)
+        if self._pending_drop_path:
+            self.open_document(self._pending_drop_path)
+            self._pending_drop_path = None
     
     def closeEvent(self, event):
         """Handle application close event."""
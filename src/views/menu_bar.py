@@ -1,7 +1,35 @@
+from collections import deque
+
 from PySide6.QtWidgets import QMenuBar, QMenu, QMessageBox
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtCore import Signal, Qt
 
+# Built once per process instead of per dialog invocation
+_SHORTCUTS_HTML = """
+<h2>Keyboard Shortcuts</h2>
+<table>
+<tr><th>Action</th><th>Shortcut</th></tr>
+<tr><td>Open File</td><td>Ctrl+O</td></tr>
+<tr><td>Save</td><td>Ctrl+S</td></tr>
+<tr><td>Save As</td><td>Ctrl+Shift+S</td></tr>
+<tr><td>Zoom In</td><td>Ctrl++</td></tr>
+<tr><td>Zoom Out</td><td>Ctrl+-</td></tr>
+<tr><td>Reset Zoom</td><td>Ctrl+0</td></tr>
+<tr><td>Toggle Thumbnails</td><td>F9</td></tr>
+<tr><td>Toggle Toolbar</td><td>F8</td></tr>
+<tr><td>Go to Page</td><td>Alt+G</td></tr>
+<tr><td>Quit</td><td>Ctrl+Q</td></tr>
+</table>
+
+<p>Mouse & Trackpad:</p>
+<ul>
+<li>Scroll to navigate through pages</li>
+<li>Ctrl + scroll to zoom at cursor position</li>
+<li>Click thumbnails to jump to pages</li>
+<li>Drag splitter to resize panels</li>
+</ul>
+"""
+
 class PDFMenuBar(QMenuBar):
     """Menu bar for the PDF Editor application."""
     
@@ -17,7 +45,10 @@ class PDFMenuBar(QMenuBar):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.recent_files = []  # Store recent file paths
+        self.recent_files = deque(maxlen=5)  # MRU of recent file paths
+        # Bind the parent's close once so Quit doesn't do a parent() lookup
+        # per activation
+        self._parent_close = parent.close if parent is not None else self.close
         self.setup_menus()
         
     def setup_menus(self):
@@ -33,9 +64,17 @@ class PDFMenuBar(QMenuBar):
         open_action.triggered.connect(self.fileOpenRequested.emit)
         self.file_menu.addAction(open_action)
         
-        # Recent files submenu
+        # Recent files submenu: actions are created once and updated in
+        # place, so registering a file never rebuilds the menu
         self.recent_menu = QMenu("Recent Files", self)
         self.file_menu.addMenu(self.recent_menu)
+        self._recent_actions = []
+        for _ in range(self.recent_files.maxlen):
+            action = QAction(self)
+            action.setVisible(False)
+            action.triggered.connect(self._on_recent_triggered)
+            self.recent_menu.addAction(action)
+            self._recent_actions.append(action)
         
         self.file_menu.addSeparator()
         
@@ -61,7 +100,7 @@ class PDFMenuBar(QMenuBar):
         quit_action = QAction("&Quit", self)
         quit_action.setShortcut(QKeySequence.Quit)  # Ctrl+Q
         quit_action.setStatusTip("Quit the application")
-        quit_action.triggered.connect(self.parent().close)
+        quit_action.triggered.connect(self._parent_close)
         self.file_menu.addAction(quit_action)
         
         # View menu
@@ -115,15 +154,22 @@ class PDFMenuBar(QMenuBar):
         reset_zoom_action.triggered.connect(self.zoomResetRequested.emit)
         zoom_menu.addAction(reset_zoom_action)
         
-        # Help menu
-        help_menu = QMenu("&Help", self)
-        self.addMenu(help_menu)
-        
+        # Help menu: populated lazily on first open — none of its actions
+        # carry shortcuts, so deferring them costs nothing at startup
+        self.help_menu = QMenu("&Help", self)
+        self.help_menu.aboutToShow.connect(self._build_help_menu)
+        self.addMenu(self.help_menu)
+
+    def _build_help_menu(self):
+        """Populate the Help menu on first open."""
+        if not self.help_menu.isEmpty():
+            return
+
         # Keyboard shortcuts help
         shortcuts_action = QAction("&Keyboard Shortcuts", self)
         shortcuts_action.setStatusTip("Show keyboard shortcuts")
         shortcuts_action.triggered.connect(self.show_shortcuts)
-        help_menu.addAction(shortcuts_action)
+        self.help_menu.addAction(shortcuts_action)
         
     def update_actions(self, document_loaded: bool):
         """Update action states based on whether a document is loaded.
@@ -142,17 +188,25 @@ class PDFMenuBar(QMenuBar):
         """
         if filepath in self.recent_files:
             self.recent_files.remove(filepath)
-        self.recent_files.insert(0, filepath)
-        self.recent_files = self.recent_files[:5]  # Keep only 5 most recent
+        self.recent_files.appendleft(filepath)  # maxlen evicts the oldest
         self.update_recent_menu()
         
     def update_recent_menu(self):
-        """Update the recent files menu."""
-        self.recent_menu.clear()
-        for filepath in self.recent_files:
-            action = QAction(filepath, self)
-            action.triggered.connect(lambda f=filepath: self.open_recent_file(f))
-            self.recent_menu.addAction(action)
+        """Refresh the pre-created recent-file actions in place."""
+        for i, action in enumerate(self._recent_actions):
+            if i < len(self.recent_files):
+                filepath = self.recent_files[i]
+                action.setText(filepath)
+                action.setData(filepath)
+                action.setVisible(True)
+            else:
+                action.setVisible(False)
+
+    def _on_recent_triggered(self):
+        """Open the recent file carried by the triggering action."""
+        action = self.sender()
+        if action is not None:
+            self.open_recent_file(action.data())
             
     def open_recent_file(self, filepath: str):
         """Open a file from the recent files list.
@@ -165,28 +219,4 @@ class PDFMenuBar(QMenuBar):
         
     def show_shortcuts(self):
         """Show keyboard shortcuts help dialog."""
-        shortcuts = """
-        <h2>Keyboard Shortcuts</h2>
-        <table>
-        <tr><th>Action</th><th>Shortcut</th></tr>
-        <tr><td>Open File</td><td>Ctrl+O</td></tr>
-        <tr><td>Save</td><td>Ctrl+S</td></tr>
-        <tr><td>Save As</td><td>Ctrl+Shift+S</td></tr>
-        <tr><td>Zoom In</td><td>Ctrl++</td></tr>
-        <tr><td>Zoom Out</td><td>Ctrl+-</td></tr>
-        <tr><td>Reset Zoom</td><td>Ctrl+0</td></tr>
-        <tr><td>Toggle Thumbnails</td><td>F9</td></tr>
-        <tr><td>Toggle Toolbar</td><td>F8</td></tr>
-        <tr><td>Go to Page</td><td>Alt+G</td></tr>
-        <tr><td>Quit</td><td>Ctrl+Q</td></tr>
-        </table>
-        
-        <p>Mouse & Trackpad:</p>
-        <ul>
-        <li>Scroll to navigate through pages</li>
-        <li>Ctrl + scroll to zoom at cursor position</li>
-        <li>Click thumbnails to jump to pages</li>
-        <li>Drag splitter to resize panels</li>
-        </ul>
-        """
-        QMessageBox.information(self, "Keyboard Shortcuts", shortcuts)
\ No newline at end of file
+        QMessageBox.information(self, "Keyboard Shortcuts", _SHORTCUTS_HTML)
\ No newline at end of file
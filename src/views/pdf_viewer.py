@@ -1,9 +1,73 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from math import ceil
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QLabel, 
     QSizePolicy
 )
-from PySide6.QtGui import QPixmap, QImage, QWheelEvent
-from PySide6.QtCore import Qt, Signal, QSize, QPoint, QEvent
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QWheelEvent
+from PySide6.QtCore import (
+    Qt, Signal, QSize, QPoint, QEvent, QTimer, QObject, QRunnable, QThreadPool
+)
+
+# Parsed once per setStyleSheet call; hoisted so each viewer instance
+# hands Qt the same interned string instead of rebuilding the literal.
+# Rules here are viewer-local; app-wide styling lives in Theme.
+_VIEWER_QSS = """
+    QScrollArea {
+        background-color: #1e1e1e;
+        border: none;
+    }
+    QWidget#container {
+        background-color: #1e1e1e;
+    }
+    QLabel {
+        background-color: #252526;
+        border: 1px solid #3d3d3d;
+        border-radius: 3px;
+        padding: 10px;
+    }
+"""
+
+class ScaleSignals(QObject):
+    """Signal holder for background scale tasks."""
+
+    # (page, zoom, smoothly scaled QImage)
+    scaled = Signal(int, float, QImage)
+
+class ScaleTask(QRunnable):
+    """Smoothly rescales one page image off the GUI thread.
+
+    QImage is thread-safe where QPixmap is not, so the task works on a
+    QImage copy and the QPixmap conversion happens in the receiving slot.
+
+    Args:
+        page_number: The page the image belongs to (0-based)
+        image: The original page image
+        width: Target width in pixels
+        height: Target height in pixels
+        zoom: The zoom level this scale is for (stale results are dropped)
+        signals: Shared ScaleSignals instance to emit the result on
+    """
+
+    def __init__(self, page_number: int, image: QImage, width: int,
+                 height: int, zoom: float, signals: ScaleSignals):
+        super().__init__()
+        self.page_number = page_number
+        self.image = image
+        self.width = width
+        self.height = height
+        self.zoom = zoom
+        self.signals = signals
+
+    def run(self):
+        scaled = self.image.scaled(
+            self.width, self.height,
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation
+        )
+        self.signals.scaled.emit(self.page_number, self.zoom, scaled)
 
 class PDFPageLabel(QLabel):
     """Label for displaying a single PDF page."""
@@ -11,7 +75,16 @@ class PDFPageLabel(QLabel):
     def __init__(self, page_number: int, parent=None):
         super().__init__(parent)
         self.page_number = page_number
-        self.original_pixmap = None  # Store original unscaled pixmap
+        # Original unscaled page image. Kept as QImage: a flat, thread-safe
+        # pixel buffer that avoids the raster/texture roundtrips QPixmap
+        # storage incurs on some backends
+        self.original_image = None
+        # Zoom factor the original was rendered at; display scaling works
+        # relative to this, so higher-DPI re-renders slot in transparently
+        self.render_zoom = 1.0
+        # Set when a zoom change happened while the page was off screen;
+        # the rescale runs lazily once the page scrolls back into view
+        self.scale_dirty = False
         self.setAlignment(Qt.AlignCenter)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
@@ -21,6 +94,23 @@ class PDFViewerWidget(QWidget):
     # Signals
     zoomChanged = Signal(float)  # Emitted when zoom level changes
     pageChanged = Signal(int)    # Emitted when visible page changes
+    pageReleased = Signal(int)   # Emitted when a page's pixmaps are dropped
+    # Emitted when the stored original is too coarse for the current zoom
+    # and a higher-DPI render is wanted: (page_number, target_zoom)
+    rerenderRequested = Signal(int, float)
+
+    # Pages further than this from the visible one have their pixmaps
+    # released; labels stay in the layout so geometry is stable
+    REALIZE_BUFFER = 3
+    # Originals may exceed the current display size by this factor before
+    # being downsampled; bounds resident memory per page while leaving
+    # headroom for small zoom-ins without a re-render
+    OVERSAMPLE_CAP = 1.5
+    # Upper bound on the zoom requested from the renderer
+    MAX_RENDER_ZOOM = 4.0
+    # Byte budget for stored originals across all pages; least recently
+    # displayed pages outside the viewport buffer are released first
+    ORIGINAL_BUDGET_BYTES = 256 * 1024 * 1024
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -28,6 +118,30 @@ class PDFViewerWidget(QWidget):
         self.total_pages = 0
         self.zoom_level = 1.0
         self.page_labels = []  # List of PDFPageLabel widgets
+        # Cached y-offset per page for O(log N) visible-page lookup;
+        # rebuilt lazily whenever geometry may have changed
+        self._page_tops = []
+        self._page_tops_dirty = True
+        # Coalesce rapid zoom changes (wheel ticks, pinch microdeltas) into
+        # a single SmoothTransformation rescale pass after a short idle
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(30)
+        self._zoom_timer.timeout.connect(self._update_all_pages)
+        # Generation tag namespacing scaled-pixmap cache keys per document
+        self._cache_generation = 0
+        # Smooth rescaling runs on background workers; the GUI thread shows
+        # an instant nearest-neighbor preview in the meantime
+        self._scale_pool = QThreadPool(self)
+        self._scale_signals = ScaleSignals()
+        # Recency order and byte sizes of stored originals, for eviction
+        # when the budget is exceeded (huge pages, very wide buffers)
+        self._original_lru = OrderedDict()
+        self._original_bytes = 0
+        # Coalesces per-pixel scrollbar ticks into at most one page-
+        # tracking pass per ~frame
+        self._scroll_pending = False
+        self._scale_signals.scaled.connect(self._on_smooth_scaled)
         self.setup_ui()
         
         # Enable touch gestures
@@ -40,10 +154,7 @@ class PDFViewerWidget(QWidget):
         self.layout.setSpacing(20)  # Space between pages
         
         # Container widget for pages
-        self.container = QWidget()
-        self.container_layout = QVBoxLayout(self.container)
-        self.container_layout.setContentsMargins(10, 10, 10, 10)
-        self.container_layout.setSpacing(20)
+        self._build_container()
         
         # Scroll area for the pages
         self.scroll_area = QScrollArea(self)
@@ -55,35 +166,28 @@ class PDFViewerWidget(QWidget):
         self.layout.addWidget(self.scroll_area)
         
         # Set dark theme
-        self.setStyleSheet("""
-            QScrollArea {
-                background-color: #1e1e1e;
-                border: none;
-            }
-            QWidget#container {
-                background-color: #1e1e1e;
-            }
-            QLabel {
-                background-color: #252526;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                padding: 10px;
-            }
-        """)
-        self.container.setObjectName("container")
-        
+        self.setStyleSheet(_VIEWER_QSS)
         # Enable mouse tracking for wheel events
         self.setMouseTracking(True)
         
-        # Connect scroll signals
+        # Connect scroll signals; valueChanged fires per scrolled pixel,
+        # so the handler runs through a ~60 Hz coalescing gate
         self.scroll_area.verticalScrollBar().valueChanged.connect(
-            self._on_scroll_changed
+            self._schedule_scroll_update
         )
         
         # Install event filter on scroll area and viewport
         self.scroll_area.viewport().installEventFilter(self)
         self.scroll_area.installEventFilter(self)
     
+    def _build_container(self):
+        """Create a fresh page container widget and its layout."""
+        self.container = QWidget()
+        self.container.setObjectName("container")
+        self.container_layout = QVBoxLayout(self.container)
+        self.container_layout.setContentsMargins(10, 10, 10, 10)
+        self.container_layout.setSpacing(20)
+
     def event(self, event):
         """Handle various events including gestures.
         
@@ -118,12 +222,9 @@ class PDFViewerWidget(QWidget):
             # Calculate new zoom level
             new_zoom = self.zoom_level * scale_factor
             
-            # Apply zoom with the center point
+            # Apply zoom with the center point; set_zoom emits zoomChanged
             self.set_zoom(new_zoom, center)
             
-            # Emit zoom changed signal for controller to handle
-            self.zoomChanged.emit(self.zoom_level)
-            
             return True
         return False
     
@@ -142,13 +243,10 @@ class PDFViewerWidget(QWidget):
             delta = event.angleDelta().y() / 120.0  # Number of 15-degree steps
             factor = 1.0 + (delta * 0.1)  # 10% change per step
             
-            # Calculate and set new zoom level
+            # Calculate and set new zoom level; set_zoom emits zoomChanged
             new_zoom = self.zoom_level * factor
             self.set_zoom(new_zoom, pos)
             
-            # Emit zoom changed signal for controller to handle
-            self.zoomChanged.emit(self.zoom_level)
-            
             # Prevent scrolling while zooming
             event.accept()
             return
@@ -158,12 +256,21 @@ class PDFViewerWidget(QWidget):
     
     def set_zoom(self, zoom_level: float, center=None):
         """Set zoom level and update page display.
+
+        Single source of truth for zoom: clamps once, short-circuits
+        no-op changes and emits zoomChanged exactly once per effective
+        change, so callers must not emit it themselves.
+
         Args:
             zoom_level: New zoom level to set (will be clamped between 0.1 and 5.0)"""
         zoom_level = max(0.1, min(5.0, zoom_level))  # Enforce zoom limits
-        if zoom_level != self.zoom_level:
-            self.zoom_level = zoom_level
-            self._update_all_pages()
+        if abs(zoom_level - self.zoom_level) < 1e-4:
+            return  # Trackpad microdeltas: skip the rescale cascade
+        self.zoom_level = zoom_level
+        # Restarting the timer collapses a burst of zoom events into
+        # one rescale of all pages at the final level
+        self._zoom_timer.start()
+        self.zoomChanged.emit(zoom_level)
     
     def zoom_in(self):
         """Increase zoom level by 10%."""
@@ -189,28 +296,107 @@ class PDFViewerWidget(QWidget):
         )
         self.set_zoom(1.0, center)
     
+    def _schedule_scroll_update(self):
+        """Coalesce scrollbar ticks into one update per ~16 ms."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            QTimer.singleShot(16, self._do_scroll_update)
+
+    def _do_scroll_update(self):
+        """Run the deferred scroll handling for the latest position."""
+        self._scroll_pending = False
+        self._on_scroll_changed()
+
     def _on_scroll_changed(self):
         """Handle scroll position changes."""
-        # Find the most visible page
-        viewport = self.scroll_area.viewport()
-        viewport_rect = viewport.rect()
-        viewport_rect.translate(0, self.scroll_area.verticalScrollBar().value())
-        
-        max_visible_area = 0
-        most_visible_page = self.current_page
-        
-        for label in self.page_labels:
-            page_rect = label.geometry()
-            visible_rect = viewport_rect.intersected(page_rect)
-            visible_area = visible_rect.width() * visible_rect.height()
-            
-            if visible_area > max_visible_area:
-                max_visible_area = visible_area
-                most_visible_page = label.page_number
-        
+        if not self.page_labels:
+            return
+
+        # Pages are stacked vertically in order, so the page under the
+        # viewport center is found by bisecting the cached y-offsets
+        # instead of intersecting every label's rect
+        if self._page_tops_dirty:
+            self._page_tops = [label.pos().y() for label in self.page_labels]
+            self._page_tops_dirty = False
+
+        center_y = (self.scroll_area.verticalScrollBar().value()
+                    + self.scroll_area.viewport().height() // 2)
+        most_visible_page = bisect_right(self._page_tops, center_y) - 1
+        most_visible_page = max(0, min(most_visible_page, len(self.page_labels) - 1))
+        if len(self._page_tops) > 1 and self._page_tops[-1] <= self._page_tops[0]:
+            # Layout hasn't run yet; positions are meaningless
+            most_visible_page = self.current_page
+
         if most_visible_page != self.current_page:
             self.current_page = most_visible_page
             self.pageChanged.emit(most_visible_page)
+
+        self._release_distant_pages(most_visible_page)
+        self._rescale_dirty_pages(most_visible_page)
+
+    def _release_distant_pages(self, center_page: int):
+        """Drop pixmaps of pages far outside the viewport buffer zone.
+
+        Only the pages within REALIZE_BUFFER of the visible one keep their
+        pixel data; everything else is released (and re-requested on demand
+        when scrolled back into view), so resident pixmap memory is bounded
+        by the buffer size, not the document size.
+
+        Args:
+            center_page: The currently visible page number
+        """
+        low = center_page - self.REALIZE_BUFFER
+        high = center_page + self.REALIZE_BUFFER
+        for label in self.page_labels:
+            if label.original_image is None:
+                continue
+            if label.page_number < low or label.page_number > high:
+                self._release_label(label)
+            else:
+                # Refresh recency so budget eviction prefers other pages
+                if label.page_number in self._original_lru:
+                    self._original_lru.move_to_end(label.page_number)
+
+    def _release_label(self, label: PDFPageLabel):
+        """Drop a label's pixel data while keeping its layout slot.
+
+        Args:
+            label: The page label to release
+        """
+        # Freeze the label's height so scroll geometry doesn't shift
+        label.setMinimumHeight(label.height())
+        label.original_image = None
+        label.clear()
+        self._forget_original(label.page_number)
+        self.pageReleased.emit(label.page_number)
+
+    def _forget_original(self, page_number: int):
+        """Remove a page from the original-image byte accounting.
+
+        Args:
+            page_number: Zero-based page number
+        """
+        size = self._original_lru.pop(page_number, None)
+        if size is not None:
+            self._original_bytes -= size
+
+    def _evict_over_budget(self):
+        """Release least recently displayed originals over the byte budget.
+
+        Pages within the viewport buffer are never evicted, so at worst
+        resident memory is O(visible + buffer) regardless of page size.
+        """
+        low = self.current_page - self.REALIZE_BUFFER
+        high = self.current_page + self.REALIZE_BUFFER
+        while self._original_bytes > self.ORIGINAL_BUDGET_BYTES:
+            victim = next(
+                (page for page in self._original_lru
+                 if page < low or page > high),
+                None
+            )
+            if victim is None or not (0 <= victim < len(self.page_labels)):
+                break
+            self._release_label(self.page_labels[victim])
     
     def go_to_page(self, page_number: int) -> bool:
         """Scroll to a specific page.
@@ -252,71 +438,251 @@ class PDFViewerWidget(QWidget):
         self.clear()
         self.total_pages = total_pages
         self.current_page = 0
-        
-        # Create labels for all pages
-        for i in range(total_pages):
-            label = PDFPageLabel(i)
-            self.page_labels.append(label)
-            self.container_layout.addWidget(label)
+
+        # Create labels for all pages. Suspend repaints and layout
+        # activation during the bulk insert so the container relayouts
+        # once instead of once per page
+        self.container.setUpdatesEnabled(False)
+        self.container_layout.setEnabled(False)
+        try:
+            self.page_labels = [None] * total_pages
+            for i in range(total_pages):
+                label = PDFPageLabel(i)
+                self.page_labels[i] = label
+                self.container_layout.addWidget(label)
+        finally:
+            self.container_layout.setEnabled(True)
+            self.container.setUpdatesEnabled(True)
+        self.container_layout.activate()
+        self._page_tops_dirty = True
         
         # Emit signal for initial page and update UI
         self.pageChanged.emit(0)  # This will trigger page loading in MainWindow
     
-    def display_page(self, page_number: int, image_or_pixmap):
+    def display_page(self, page_number: int, image_or_pixmap, render_zoom: float = 1.0):
         """Display a page.
-        
+
         Args:
             page_number: Zero-based page number
             image_or_pixmap: QImage or QPixmap to display
+            render_zoom: Zoom factor the image was rendered at
         """
         if not (0 <= page_number < len(self.page_labels)):
             return
-            
+
         if isinstance(image_or_pixmap, QImage):
-            pixmap = QPixmap.fromImage(image_or_pixmap)
+            image = image_or_pixmap
         else:
-            pixmap = image_or_pixmap
-        
-        if pixmap:
-            # Store original pixmap
-            self.page_labels[page_number].original_pixmap = pixmap
-            
-            # Scale pixmap using current zoom
-            scaled_pixmap = pixmap.scaled(
-                int(pixmap.width() * self.zoom_level),
-                int(pixmap.height() * self.zoom_level),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            # Set the page label's pixmap
-            self.page_labels[page_number].setPixmap(scaled_pixmap)
+            image = image_or_pixmap.toImage()
+
+        if image:
+            label = self.page_labels[page_number]
+            # Keep originals no larger than the display size plus the
+            # over-provision cap, so per-page memory tracks the current
+            # zoom rather than the render DPI
+            if render_zoom > self.zoom_level * self.OVERSAMPLE_CAP:
+                capped_zoom = self.zoom_level * self.OVERSAMPLE_CAP
+                image = image.scaled(
+                    int(image.width() * capped_zoom / render_zoom),
+                    int(image.height() * capped_zoom / render_zoom),
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation
+                )
+                render_zoom = capped_zoom
+
+            # Skip the whole scale pass when the label already shows this
+            # page at the target size (pageChanged often retriggers loads)
+            scale = self.zoom_level / render_zoom
+            target_width = int(image.width() * scale)
+            target_height = int(image.height() * scale)
+            current = label.pixmap()
+            if (label.original_image is not None
+                    and label.render_zoom == render_zoom and current
+                    and current.width() == target_width
+                    and current.height() == target_height):
+                return
+
+            # Store original image; QPixmap conversion happens only at
+            # display size, once the scaled result is ready
+            label.original_image = image
+            label.render_zoom = render_zoom
+            label.scale_dirty = False
+            self._forget_original(page_number)
+            self._original_lru[page_number] = image.sizeInBytes()
+            self._original_bytes += image.sizeInBytes()
+            self._evict_over_budget()
+            label.setMinimumHeight(0)  # Undo any release-time height freeze
+            self._page_tops_dirty = True  # Label height may change
+
+            if render_zoom == self.zoom_level:
+                # No resampling needed at native render size
+                label.setPixmap(QPixmap.fromImage(image))
+                return
+
+            # Reuse a previously scaled pixmap for this zoom if one is
+            # still cached; otherwise show a fast preview and rescale
+            # smoothly in the background
+            key = self._scaled_cache_key(page_number)
+            scaled_pixmap = QPixmap()
+            if QPixmapCache.find(key, scaled_pixmap):
+                label.setPixmap(scaled_pixmap)
+            else:
+                self._preview_and_rescale(label, image)
     
+    def _scaled_cache_key(self, page_number: int) -> str:
+        """Build the QPixmapCache key for a page scaled at the current zoom.
+
+        Args:
+            page_number: Zero-based page number
+
+        Returns:
+            str: The cache key
+        """
+        return f"v{self._cache_generation}:p{page_number}:z{round(self.zoom_level * 100)}"
+
+    def unload_page(self, page_number: int):
+        """Drop a page's pixmaps to reclaim memory.
+
+        The label stays in the layout (keeping scroll geometry stable) but
+        releases both the original and the scaled pixmap; the page can be
+        re-rendered on demand when it scrolls back into view.
+
+        Args:
+            page_number: Zero-based page number
+        """
+        if 0 <= page_number < len(self.page_labels):
+            label = self.page_labels[page_number]
+            label.original_image = None
+            label.clear()
+            self._forget_original(page_number)
+
+    def _preview_and_rescale(self, label: PDFPageLabel, image: QImage):
+        """Show a fast-scaled preview and queue the smooth rescale.
+
+        The nearest-neighbor scale is cheap enough for the GUI thread and
+        appears immediately; a background task replaces it with the
+        SmoothTransformation result when ready.
+
+        Args:
+            label: The page label to update
+            image: The original (unscaled) page image
+        """
+        scale = self.zoom_level / label.render_zoom
+        width = int(image.width() * scale)
+        height = int(image.height() * scale)
+        label.setPixmap(QPixmap.fromImage(image.scaled(
+            width, height, Qt.KeepAspectRatio, Qt.FastTransformation
+        )))
+        self._scale_pool.start(ScaleTask(
+            label.page_number, image,
+            width, height, self.zoom_level, self._scale_signals
+        ))
+
+    def _on_smooth_scaled(self, page_number: int, zoom: float, image: QImage):
+        """Swap in a background-scaled image if it is still current.
+
+        Args:
+            page_number: The page the image belongs to (0-based)
+            zoom: The zoom level the image was scaled for
+            image: The smoothly scaled image
+        """
+        if zoom != self.zoom_level:
+            return  # Superseded by a newer zoom level
+        if not 0 <= page_number < len(self.page_labels):
+            return
+        label = self.page_labels[page_number]
+        if label.original_image is None:
+            return  # Page was released in the meantime
+        scaled_pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._scaled_cache_key(page_number), scaled_pixmap)
+        label.setPixmap(scaled_pixmap)
+
     def _update_all_pages(self):
-        """Update all page displays with current zoom level."""
+        """Apply the current zoom level to pages in the viewport band.
+
+        Off-screen pages are only marked dirty; their rescale runs lazily
+        when they scroll into view, so a zoom change costs the visible
+        band's pixel area rather than the whole document's.
+        """
+        low = self.current_page - self.REALIZE_BUFFER
+        high = self.current_page + self.REALIZE_BUFFER
         for label in self.page_labels:
-            if original := label.original_pixmap:
-                # Scale from original pixmap to maintain quality
-                new_width = int(original.width() * self.zoom_level)
-                new_height = int(original.height() * self.zoom_level)
-                
-                # Only rescale if dimensions actually changed
-                current = label.pixmap()
-                if not current or current.width() != new_width or current.height() != new_height:
-                    scaled_pixmap = original.scaled(
-                        new_width,
-                        new_height,
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
-                    label.setPixmap(scaled_pixmap)
+            if label.original_image is None:
+                continue
+            if low <= label.page_number <= high:
+                self._rescale_label(label)
+            else:
+                label.scale_dirty = True
+        self._page_tops_dirty = True
+
+    def _rescale_dirty_pages(self, center_page: int):
+        """Rescale in-view pages whose zoom changed while off screen.
+
+        Args:
+            center_page: The currently visible page number
+        """
+        low = center_page - self.REALIZE_BUFFER
+        high = center_page + self.REALIZE_BUFFER
+        for label in self.page_labels[max(0, low):high + 1]:
+            if label.scale_dirty and label.original_image is not None:
+                self._rescale_label(label)
+
+    def _rescale_label(self, label: PDFPageLabel):
+        """Bring one label's displayed pixmap up to the current zoom.
+
+        Args:
+            label: The page label to update
+        """
+        original = label.original_image
+        label.scale_dirty = False
+        # Scale from original image to maintain quality
+        scale = self.zoom_level / label.render_zoom
+        if abs(scale - 1.0) < 1e-4:
+            # Identity zoom (the common state after open/reset): reuse the
+            # original directly, no resample at all
+            current = label.pixmap()
+            if (not current or current.width() != original.width()
+                    or current.height() != original.height()):
+                label.setPixmap(QPixmap.fromImage(original))
+            return
+        new_width = int(original.width() * scale)
+        new_height = int(original.height() * scale)
+
+        # Only rescale if dimensions actually changed
+        current = label.pixmap()
+        if not current or current.width() != new_width or current.height() != new_height:
+            key = self._scaled_cache_key(label.page_number)
+            scaled_pixmap = QPixmap()
+            if QPixmapCache.find(key, scaled_pixmap):
+                label.setPixmap(scaled_pixmap)
+            else:
+                self._preview_and_rescale(label, original)
+        # Upscaling past the stored render resolution blurs; ask for a
+        # fresh render at a zoom that covers the new level
+        if self.zoom_level > label.render_zoom:
+            target = min(self.MAX_RENDER_ZOOM,
+                         ceil(self.zoom_level * 2) / 2)
+            if target > label.render_zoom:
+                self.rerenderRequested.emit(label.page_number, target)
     
     def clear(self):
-        """Clear all pages."""
-        for label in self.page_labels:
-            label.setParent(None)
-            label.deleteLater()
+        """Clear all pages.
+
+        The labels are torn down with their container in one shot rather
+        than removed from the layout one by one, which would trigger a
+        layout recomputation per label.
+        """
+        old_container = self.container
+        old_container.setParent(None)
+        old_container.deleteLater()
+        self._build_container()
+        self.scroll_area.setWidget(self.container)
         self.page_labels.clear()
+        self._original_lru.clear()
+        self._original_bytes = 0
+        self._page_tops = []
+        self._page_tops_dirty = True
+        self._cache_generation += 1  # Retire this document's scaled pixmaps
         self.total_pages = 0
         self.current_page = 0
     
@@ -340,9 +706,8 @@ class PDFViewerWidget(QWidget):
             delta = event.angleDelta().y() / 120.0
             factor = 1.0 + (delta * 0.1)
             
-            # Calculate and set new zoom level
+            # Calculate and set new zoom level; set_zoom emits zoomChanged
             new_zoom = self.zoom_level * factor
             self.set_zoom(new_zoom)
-            self.zoomChanged.emit(self.zoom_level)
             return True  # Prevent event from being processed further
         return super().eventFilter(obj, event)
\ No newline at end of file
@@ -2,18 +2,51 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel,
     QListWidget, QListWidgetItem
 )
-from PySide6.QtGui import QPixmap, QIcon
-from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtGui import QColor, QImage, QPixmap, QIcon
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QTimer
+from collections import OrderedDict
+
+# Item data role marking whether a row shows a real thumbnail or the
+# shared placeholder icon
+_LOADED_ROLE = Qt.UserRole + 1
 
 class PDFThumbnailPanel(QWidget):
     """Side panel showing page thumbnails."""
     
     # Signals
     pageSelected = Signal(int)  # Emitted when a thumbnail is selected
-    
+
+    # Cap on fully rendered icons kept at once; older ones revert to
+    # placeholders and re-render on demand when scrolled back into view
+    MAX_RENDERED = 64
+
+    # Shared size values: QSize is immutable from our side, so one
+    # instance serves every item instead of a temporary per call
+    _THUMB_SIZE = QSize(120, 160)
+    _ITEM_SIZE_HINT = QSize(130, 180)  # Width for icon + padding
+    _PANEL_SIZE_HINT = QSize(150, 600)  # Default width for thumbnail panel
+
+    # Shared placeholder icon for unloaded rows; Qt's implicit sharing
+    # means every row references the same 120x160 backing pixmap
+    _PLACEHOLDER_ICON = None
+
+    @classmethod
+    def _placeholder(cls) -> QIcon:
+        """Return the shared placeholder icon, building it on first use."""
+        if cls._PLACEHOLDER_ICON is None:
+            pixmap = QPixmap(120, 160)
+            pixmap.fill(QColor("#2a2d2e"))
+            cls._PLACEHOLDER_ICON = QIcon(pixmap)
+        return cls._PLACEHOLDER_ICON
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_page = 0
+        # Recency order of pages with a rendered icon (LRU eviction)
+        self._rendered_lru = OrderedDict()
+        # Pages already added through add_thumbnail; O(1) dedup that stays
+        # correct when workers deliver pages out of order
+        self._added_pages = set()
         self.setup_ui()
         self.setVisible(True)  # Ensure visible by default
     
@@ -38,10 +71,13 @@ class PDFThumbnailPanel(QWidget):
         # Thumbnail list
         self.list_widget = QListWidget()
         self.list_widget.setViewMode(QListWidget.IconMode)
-        self.list_widget.setIconSize(QSize(120, 160))
+        self.list_widget.setIconSize(self._THUMB_SIZE)
         self.list_widget.setSpacing(10)
         self.list_widget.setMovement(QListWidget.Static)
         self.list_widget.setResizeMode(QListWidget.Adjust)
+        # All items share one size hint, so let the view compute scroll
+        # geometry in O(1) instead of measuring every item
+        self.list_widget.setUniformItemSizes(True)
         self.list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.list_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.list_widget.itemClicked.connect(self._on_thumbnail_clicked)
@@ -69,6 +105,7 @@ class PDFThumbnailPanel(QWidget):
         
         layout.addWidget(self.list_widget)
     
+    @Slot(QListWidgetItem)
     def _on_thumbnail_clicked(self, item: QListWidgetItem):
         """Handle thumbnail selection.
         
@@ -80,40 +117,148 @@ class PDFThumbnailPanel(QWidget):
             self.current_page = page_number
             self.pageSelected.emit(page_number)
     
-    def add_thumbnail(self, pixmap: QPixmap, page_number: int):
+    def add_thumbnail(self, image_or_pixmap, page_number: int):
         """Add a page thumbnail.
         
         Args:
-            pixmap: The page image
+            image_or_pixmap: QImage or QPixmap of the page. Workers hand in
+                QImages (thread-safe); the QPixmap conversion happens here,
+                on the GUI thread, only for thumbnails actually added.
             page_number: The page number (0-based)
         """
-        # Check if page already exists
-        if page_number < self.list_widget.count():
+        # Set membership instead of a positional count comparison, which
+        # would drop pages delivered out of order by parallel workers
+        if page_number in self._added_pages:
             return  # Skip if thumbnail for this page already exists
-            
+
+        if isinstance(image_or_pixmap, QImage):
+            pixmap = QPixmap.fromImage(image_or_pixmap)
+        else:
+            pixmap = image_or_pixmap
+
         # Create thumbnail
         scaled = pixmap.scaled(
             120, 160,
             Qt.KeepAspectRatio,
             Qt.SmoothTransformation
         )
-        
-        # Create list item
-        item = QListWidgetItem()
+
+        # Backfill placeholder rows so an out-of-order page lands at its
+        # own row instead of the end of the list
+        while self.list_widget.count() <= page_number:
+            filler = QListWidgetItem()
+            filler.setIcon(self._placeholder())
+            filler.setData(_LOADED_ROLE, False)
+            filler.setText(f"Page {self.list_widget.count() + 1}")
+            filler.setTextAlignment(Qt.AlignCenter)
+            filler.setSizeHint(self._ITEM_SIZE_HINT)
+            self.list_widget.addItem(filler)
+
+        item = self.list_widget.item(page_number)
         item.setIcon(QIcon(scaled))
-        item.setText(f"Page {page_number + 1}")
-        item.setTextAlignment(Qt.AlignCenter)
-        item.setSizeHint(QSize(130, 180))  # Width for icon + padding
-        
-        self.list_widget.addItem(item)
+        item.setData(_LOADED_ROLE, True)
+        self._added_pages.add(page_number)
+        self._touch_rendered(page_number)
         
         # Select first page by default
         if page_number == 0:
             self.list_widget.setCurrentItem(item)
     
+    def populate_placeholders(self, page_count: int):
+        """Fill the list with placeholder items, one per page.
+
+        Placeholders carry no icon; the actual thumbnails are rendered
+        lazily for the visible items only (see set_thumbnail).
+
+        Args:
+            page_count: Total number of pages in the document
+        """
+        # Suppress repaints/relayouts while inserting in bulk — one layout
+        # pass for N items instead of one per insertion
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            placeholder = self._placeholder()
+            size_hint = self._ITEM_SIZE_HINT
+            # Formatting stays out of the Qt insertion loop
+            labels = [f"Page {n}" for n in range(1, page_count + 1)]
+            for page_number, label in enumerate(labels):
+                item = QListWidgetItem()
+                item.setIcon(placeholder)
+                item.setData(_LOADED_ROLE, False)
+                item.setText(label)
+                item.setTextAlignment(Qt.AlignCenter)
+                item.setData(Qt.UserRole, page_number)
+                item.setSizeHint(size_hint)
+                self.list_widget.addItem(item)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
+
+        if page_count > 0:
+            self.list_widget.setCurrentItem(self.list_widget.item(0))
+
+    def set_thumbnail(self, page_number: int, image_or_pixmap):
+        """Set the rendered thumbnail on an existing placeholder item.
+
+        Args:
+            page_number: The page number (0-based)
+            image_or_pixmap: QImage or QPixmap of the page
+        """
+        item = self.list_widget.item(page_number)
+        if item is None:
+            return
+        if isinstance(image_or_pixmap, QImage):
+            pixmap = QPixmap.fromImage(image_or_pixmap)
+        else:
+            pixmap = image_or_pixmap
+        if pixmap.width() > 120 or pixmap.height() > 160:
+            # Pre-scaled images (the worker path) skip this GUI-thread pass
+            pixmap = pixmap.scaled(
+                120, 160,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+        item.setIcon(QIcon(pixmap))
+        item.setData(_LOADED_ROLE, True)
+        self._touch_rendered(page_number)
+
+    def _touch_rendered(self, page_number: int):
+        """Refresh a page's icon recency and evict over the render cap.
+
+        Evicted items get their null placeholder icon back, which also
+        re-marks them for visible_placeholder_pages, so they re-render
+        automatically when scrolled into view.
+
+        Args:
+            page_number: The page number whose icon was just set (0-based)
+        """
+        self._rendered_lru[page_number] = None
+        self._rendered_lru.move_to_end(page_number)
+        while len(self._rendered_lru) > self.MAX_RENDERED:
+            evicted, _ = self._rendered_lru.popitem(last=False)
+            if (item := self.list_widget.item(evicted)) is not None:
+                item.setIcon(self._placeholder())
+                item.setData(_LOADED_ROLE, False)
+
+    def visible_placeholder_pages(self) -> list:
+        """Return the page numbers of visible items still lacking an icon.
+
+        Returns:
+            list: 0-based page numbers, in display order
+        """
+        viewport_rect = self.list_widget.viewport().rect()
+        pages = []
+        for row in range(self.list_widget.count()):
+            item = self.list_widget.item(row)
+            if not item.data(_LOADED_ROLE) and \
+                    self.list_widget.visualItemRect(item).intersects(viewport_rect):
+                pages.append(row)
+        return pages
+
     def clear(self):
         """Clear all thumbnails."""
         self.list_widget.clear()
+        self._rendered_lru.clear()
+        self._added_pages.clear()
         self.current_page = 0
     
     def select_page(self, page_number: int):
@@ -126,10 +271,13 @@ class PDFThumbnailPanel(QWidget):
             item = self.list_widget.item(page_number)
             self.list_widget.setCurrentItem(item)
             self.current_page = page_number
+            # Scrolling the strip forces layout + paint; defer it to the
+            # next event-loop tick so rapid navigation isn't blocked on it
+            QTimer.singleShot(0, self.show_current_page)
     
     def sizeHint(self) -> QSize:
         """Suggest a size for the widget."""
-        return QSize(150, 600)  # Default width for thumbnail panel
+        return self._PANEL_SIZE_HINT
     
     def show_current_page(self):
         """Ensure current page is visible in the view."""
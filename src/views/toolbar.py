@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QToolBar, QStyle, QSpinBox, QLabel
 from PySide6.QtGui import QIcon, QAction
-from PySide6.QtCore import Signal, QSize
+from PySide6.QtCore import Signal, Slot, QSize
 
 class PDFToolBar(QToolBar):
     """Main toolbar for the PDF Editor application."""
@@ -18,40 +18,67 @@ class PDFToolBar(QToolBar):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # One-shot guard: update_page_info mirrors viewer state into the
+        # spinbox and must not bounce the change back as a page request
+        self._suppress_spin = False
         self.setMovable(False)
         self.setIconSize(QSize(24, 24))
         self.setup_actions()
     
+    # Icons resolved once per (theme name, fallback) pair and shared by
+    # every action and toolbar instance, so mixed-DPI repaints reuse the
+    # same QIcon's pixmap cache instead of re-rasterizing per action
+    _icon_cache = {}
+
+    def _themed_icon(self, theme_name: str, fallback_kind) -> QIcon:
+        """Resolve an icon from the system theme with a style fallback.
+
+        Args:
+            theme_name: The freedesktop icon theme name
+            fallback_kind: QStyle.StandardPixmap used when the theme has
+                no such icon
+
+        Returns:
+            QIcon: The shared, cached icon
+        """
+        icon = PDFToolBar._icon_cache.get(theme_name)
+        if icon is None:
+            icon = QIcon.fromTheme(theme_name)
+            if icon.isNull():
+                icon = self.style().standardIcon(fallback_kind)
+            PDFToolBar._icon_cache[theme_name] = icon
+        return icon
+
     def setup_actions(self):
         """Set up toolbar actions."""
         # File operations
         self.openAction = self._create_action(
-            icon=self.style().standardIcon(QStyle.SP_DialogOpenButton),
+            icon=self._themed_icon("document-open", QStyle.SP_DialogOpenButton),
             text="Open PDF",
             tooltip="Open a PDF file (Ctrl+O)",
-            triggered=self.fileOpenRequested.emit
+            triggered=self.fileOpenRequested
         )
         
         self.saveAction = self._create_action(
-            icon=self.style().standardIcon(QStyle.SP_DialogSaveButton),
+            icon=self._themed_icon("document-save", QStyle.SP_DialogSaveButton),
             text="Save",
             tooltip="Save current document (Ctrl+S)",
-            triggered=self.fileSaveRequested.emit
+            triggered=self.fileSaveRequested
         )
         
         self.saveAsAction = self._create_action(
-            icon=self.style().standardIcon(QStyle.SP_DriveFDIcon),
+            icon=self._themed_icon("document-save-as", QStyle.SP_DriveFDIcon),
             text="Save As",
             tooltip="Save document as (Ctrl+Shift+S)",
-            triggered=self.fileSaveAsRequested.emit
+            triggered=self.fileSaveAsRequested
         )
         
         # Page navigation
         self.previousPageAction = self._create_action(
-            icon=self.style().standardIcon(QStyle.SP_ArrowLeft),
+            icon=self._themed_icon("go-previous", QStyle.SP_ArrowLeft),
             text="Previous",
             tooltip="Go to previous page (Alt+Left)",
-            triggered=self.previousPageRequested.emit
+            triggered=self.previousPageRequested
         )
         
         # Page number controls
@@ -62,9 +89,10 @@ class PDFToolBar(QToolBar):
         self.pageSpinBox.setFixedWidth(70)
         self.pageSpinBox.setToolTip("Current page (Alt+G)")
         self.pageSpinBox.setStatusTip("Enter page number to go to that page")
-        self.pageSpinBox.valueChanged.connect(
-            lambda value: self.pageRequested.emit(value - 1)
-        )
+        # Emit once on commit (enter/focus-out/arrow step) instead of per
+        # typed digit — typing "125" should not navigate to pages 1 and 12
+        self.pageSpinBox.setKeyboardTracking(False)
+        self.pageSpinBox.valueChanged.connect(self._on_page_spin_changed)
         
         # Total pages label
         self.totalPagesLabel = QLabel(" / 1", self)
@@ -76,32 +104,32 @@ class PDFToolBar(QToolBar):
         """)
         
         self.nextPageAction = self._create_action(
-            icon=self.style().standardIcon(QStyle.SP_ArrowRight),
+            icon=self._themed_icon("go-next", QStyle.SP_ArrowRight),
             text="Next",
             tooltip="Go to next page (Alt+Right)",
-            triggered=self.nextPageRequested.emit
+            triggered=self.nextPageRequested
         )
         
         # View operations
         self.zoomOutAction = self._create_action(
-            icon=self.style().standardIcon(QStyle.SP_ArrowDown),
+            icon=self._themed_icon("zoom-out", QStyle.SP_ArrowDown),
             text="Zoom Out",
             tooltip="Decrease zoom level (Ctrl+-)",
-            triggered=self.zoomOutRequested.emit
+            triggered=self.zoomOutRequested
         )
         
         self.zoomInAction = self._create_action(
-            icon=self.style().standardIcon(QStyle.SP_ArrowUp),
+            icon=self._themed_icon("zoom-in", QStyle.SP_ArrowUp),
             text="Zoom In",
             tooltip="Increase zoom level (Ctrl++)",
-            triggered=self.zoomInRequested.emit
+            triggered=self.zoomInRequested
         )
         
         self.zoomResetAction = self._create_action(
-            icon=self.style().standardIcon(QStyle.SP_BrowserReload),
+            icon=self._themed_icon("zoom-original", QStyle.SP_BrowserReload),
             text="100%",
             tooltip="Reset zoom to 100% (Ctrl+0)",
-            triggered=self.zoomResetRequested.emit
+            triggered=self.zoomResetRequested
         )
         
         # Add separators and actions
@@ -144,6 +172,16 @@ class PDFToolBar(QToolBar):
         # Initially disable document-specific actions
         self.update_actions(False)
     
+    @Slot(int)
+    def _on_page_spin_changed(self, value: int):
+        """Translate the 1-based spinbox value into a 0-based page request.
+
+        Args:
+            value: The new spinbox value (1-based)
+        """
+        if not self._suppress_spin:
+            self.pageRequested.emit(value - 1)
+
     def _create_action(self, icon: QIcon, text: str, tooltip: str, triggered) -> QAction:
         """Create a toolbar action.
         
@@ -151,7 +189,8 @@ class PDFToolBar(QToolBar):
             icon: Icon for the action
             text: Action text
             tooltip: Tooltip text
-            triggered: Slot to connect to triggered signal
+            triggered: Slot or signal to chain to the triggered signal;
+                passing a signal keeps the forwarding at the C++ level
             
         Returns:
             QAction: The created action
@@ -184,14 +223,19 @@ class PDFToolBar(QToolBar):
             current_page: Current page number (0-based)
             total_pages: Total number of pages
         """
-        # Update spinbox without triggering valueChanged
-        self.pageSpinBox.blockSignals(True)
-        self.pageSpinBox.setMaximum(max(1, total_pages))
-        self.pageSpinBox.setValue(current_page + 1)
-        self.pageSpinBox.blockSignals(False)
-        
-        # Update total pages label
-        self.totalPagesLabel.setText(f" / {total_pages}")
+        # Mirror viewer state without re-emitting it as a page request;
+        # the flag is cheaper than blockSignals, which walks the
+        # connection list twice per call
+        self._suppress_spin = True
+        try:
+            # Maximum and label only change on document load, not per page
+            if self.pageSpinBox.maximum() != max(1, total_pages):
+                self.pageSpinBox.setMaximum(max(1, total_pages))
+                self.totalPagesLabel.setText(f" / {total_pages}")
+            if self.pageSpinBox.value() != current_page + 1:
+                self.pageSpinBox.setValue(current_page + 1)
+        finally:
+            self._suppress_spin = False
         
         # Update navigation buttons
         self.previousPageAction.setEnabled(current_page > 0)
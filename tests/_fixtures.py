@@ -0,0 +1,65 @@
+"""Pre-built PDF blobs shared by the model tests.
+
+Synthesizing these documents through MuPDF (font shaping, content-stream
+compression, xref construction) costs far more than the tests need; the
+fixtures just decode these base64 literals, captured once from
+``doc.tobytes(garbage=4, deflate=True)``.
+"""
+
+import base64
+
+# One page containing the text "Test Page"
+SINGLE_PAGE_PDF_B64 = (
+    "JVBERi0xLjcKJcK1wrYKJSBXcml0dGVuIGJ5IE11UERGIDEuMjguMgoKMSAwIG9iago8"
+    "PC9UeXBlL0NhdGFsb2cvUGFnZXMgMiAwIFIvSW5mbzw8L1Byb2R1Y2VyKE11UERGIDEu"
+    "MjguMik+Pj4+CmVuZG9iagoKMiAwIG9iago8PC9UeXBlL1BhZ2VzL0NvdW50IDEvS2lk"
+    "c1s0IDAgUl0+PgplbmRvYmoKCjMgMCBvYmoKPDwvRm9udDw8L2hlbHYgNSAwIFI+Pj4+"
+    "CmVuZG9iagoKNCAwIG9iago8PC9UeXBlL1BhZ2UvTWVkaWFCb3hbMCAwIDU5NSA4NDJd"
+    "L1JvdGF0ZSAwL1Jlc291cmNlcyAzIDAgUi9QYXJlbnQgMiAwIFIvQ29udGVudHNbNiAw"
+    "IFJdPj4KZW5kb2JqCgo1IDAgb2JqCjw8L1R5cGUvRm9udC9TdWJ0eXBlL1R5cGUxL0Jh"
+    "c2VGb250L0hlbHZldGljYS9FbmNvZGluZy9XaW5BbnNpRW5jb2Rpbmc+PgplbmRvYmoK"
+    "CjYgMCBvYmoKPDwvTGVuZ3RoIDcyL0ZpbHRlci9GbGF0ZURlY29kZT4+CnN0cmVhbQp4"
+    "nOMq5HIK4TJUMABCQwVTAwVzcwOFkFwu/YzUnDIFQyOFkDSFaBtTEzNTc2NzEyMDUwMz"
+    "QzNzM1O72BAvLtcQrkAuANTsDlgKZW5kc3RyZWFtCmVuZG9iagoKeHJlZgowIDcKMDAw"
+    "MDAwMDAwMCA2NTUzNSBmIAowMDAwMDAwMDQyIDAwMDAwIG4gCjAwMDAwMDAxMjAgMDAw"
+    "MDAgbiAKMDAwMDAwMDE3MiAwMDAwMCBuIAowMDAwMDAwMjEzIDAwMDAwIG4gCjAwMDAw"
+    "MDAzMjAgMDAwMDAgbiAKMDAwMDAwMDQwOSAwMDAwMCBuIAoKdHJhaWxlcgo8PC9TaXpl"
+    "IDcvUm9vdCAxIDAgUi9JRFs8NzgwMjI0QzJBMzdBNTQyM0MzQTAwNDM2QzJBMkMyOEQ+"
+    "PDBENDM2MkE3N0M5QjYzMkYwNDdGMzRBNkNENEIwNTEwPl0+PgpzdGFydHhyZWYKNTQ5"
+    "CiUlRU9GCg=="
+)
+
+# Three pages containing "Page 1" .. "Page 3"
+MULTI_PAGE_PDF_B64 = (
+    "JVBERi0xLjcKJcK1wrYKJSBXcml0dGVuIGJ5IE11UERGIDEuMjguMgoKMSAwIG9iago8"
+    "PC9UeXBlL0NhdGFsb2cvUGFnZXMgMiAwIFIvSW5mbzw8L1Byb2R1Y2VyKE11UERGIDEu"
+    "MjguMik+Pj4+CmVuZG9iagoKMiAwIG9iago8PC9UeXBlL1BhZ2VzL0NvdW50IDMvS2lk"
+    "c1s0IDAgUiA3IDAgUiA5IDAgUl0+PgplbmRvYmoKCjMgMCBvYmoKPDwvRm9udDw8L2hl"
+    "bHYgNSAwIFI+Pj4+CmVuZG9iagoKNCAwIG9iago8PC9UeXBlL1BhZ2UvTWVkaWFCb3hb"
+    "MCAwIDU5NSA4NDJdL1JvdGF0ZSAwL1Jlc291cmNlcyAzIDAgUi9QYXJlbnQgMiAwIFIv"
+    "Q29udGVudHNbNiAwIFJdPj4KZW5kb2JqCgo1IDAgb2JqCjw8L1R5cGUvRm9udC9TdWJ0"
+    "eXBlL1R5cGUxL0Jhc2VGb250L0hlbHZldGljYS9FbmNvZGluZy9XaW5BbnNpRW5jb2Rp"
+    "bmc+PgplbmRvYmoKCjYgMCBvYmoKPDwvTGVuZ3RoIDY2L0ZpbHRlci9GbGF0ZURlY29k"
+    "ZT4+CnN0cmVhbQp4nOMq5HIK4TJUMABCQwVTAwVzcwOFkFwu/YzUnDIFQyOFkDSFaBtT"
+    "AzNDM3MzUyMDY0O72BAvLtcQrkAuAIKTDRMKZW5kc3RyZWFtCmVuZG9iagoKNyAwIG9i"
+    "ago8PC9UeXBlL1BhZ2UvTWVkaWFCb3hbMCAwIDU5NSA4NDJdL1JvdGF0ZSAwL1Jlc291"
+    "cmNlcyAzIDAgUi9QYXJlbnQgMiAwIFIvQ29udGVudHNbOCAwIFJdPj4KZW5kb2JqCgo4"
+    "IDAgb2JqCjw8L0xlbmd0aCA2Ni9GaWx0ZXIvRmxhdGVEZWNvZGU+PgpzdHJlYW0KeJzj"
+    "KuRyCuEyVDAAQkMFUwMFc3MDhZBcLv2M1JwyBUMjhZA0hWgbUwMzQzNzM1MjA2Mju9gQ"
+    "Ly7XEK5ALgCCng0UCmVuZHN0cmVhbQplbmRvYmoKCjkgMCBvYmoKPDwvVHlwZS9QYWdl"
+    "L01lZGlhQm94WzAgMCA1OTUgODQyXS9Sb3RhdGUgMC9SZXNvdXJjZXMgMyAwIFIvUGFy"
+    "ZW50IDIgMCBSL0NvbnRlbnRzWzEwIDAgUl0+PgplbmRvYmoKCjEwIDAgb2JqCjw8L0xl"
+    "bmd0aCA2Ni9GaWx0ZXIvRmxhdGVEZWNvZGU+PgpzdHJlYW0KeJzjKuRyCuEyVDAAQkMF"
+    "UwMFc3MDhZBcLv2M1JwyBUMjhZA0hWgbUwMzQzNzM1MjA2Nju9gQLy7XEK5ALgCCqQ0V"
+    "CmVuZHN0cmVhbQplbmRvYmoKCnhyZWYKMCAxMQowMDAwMDAwMDAwIDY1NTM1IGYgCjAw"
+    "MDAwMDAwNDIgMDAwMDAgbiAKMDAwMDAwMDEyMCAwMDAwMCBuIAowMDAwMDAwMTg0IDAw"
+    "MDAwIG4gCjAwMDAwMDAyMjUgMDAwMDAgbiAKMDAwMDAwMDMzMiAwMDAwMCBuIAowMDAw"
+    "MDAwNDIxIDAwMDAwIG4gCjAwMDAwMDA1NTUgMDAwMDAgbiAKMDAwMDAwMDY2MiAwMDAw"
+    "MCBuIAowMDAwMDAwNzk2IDAwMDAwIG4gCjAwMDAwMDA5MDQgMDAwMDAgbiAKCnRyYWls"
+    "ZXIKPDwvU2l6ZSAxMS9Sb290IDEgMCBSL0lEWzxDMzg1NjI2MDM2QzJCMTZGNDZDMkI2"
+    "QzM5NUMzODZDMz48QTUyNUM4RUIwQTVDQTAxNENFREUzNzVEODI3MTc0REM+XT4+CnN0"
+    "YXJ0eHJlZgoxMDM5CiUlRU9GCg=="
+)
+
+SINGLE_PAGE_PDF = base64.b64decode(SINGLE_PAGE_PDF_B64)
+MULTI_PAGE_PDF = base64.b64decode(MULTI_PAGE_PDF_B64)
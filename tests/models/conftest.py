@@ -0,0 +1,35 @@
+import pytest
+from src.models.pdf_document import PDFDocument
+from tests._fixtures import SINGLE_PAGE_PDF, MULTI_PAGE_PDF
+
+# The PDF fixtures are session-scoped: PDFDocument loads the file into an
+# in-memory buffer and never writes back to its source path (saves go to
+# explicit target paths), so every test can share one on-disk master.
+# The files themselves are pre-built blobs — writing them out is a single
+# write_bytes instead of a MuPDF build pipeline per session.
+
+@pytest.fixture(scope="session")
+def temp_pdf(tmp_path_factory):
+    filepath = tmp_path_factory.mktemp("pdfs") / "test.pdf"
+    filepath.write_bytes(SINGLE_PAGE_PDF)
+    return str(filepath)
+
+@pytest.fixture(scope="session")
+def multi_page_pdf(tmp_path_factory):
+    filepath = tmp_path_factory.mktemp("pdfs") / "multi_page.pdf"
+    filepath.write_bytes(MULTI_PAGE_PDF)
+    return str(filepath)
+
+# Managed documents: the with-statement guarantees the MuPDF handle is
+# released even when an assertion fails mid-test, keeping long-lived
+# xdist workers from accumulating native contexts.
+
+@pytest.fixture
+def pdf_doc(temp_pdf):
+    with PDFDocument(temp_pdf) as doc:
+        yield doc
+
+@pytest.fixture
+def multi_pdf_doc(multi_page_pdf):
+    with PDFDocument(multi_page_pdf) as doc:
+        yield doc
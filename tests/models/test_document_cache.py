@@ -7,10 +7,6 @@ class MockPixmap:
         self.width = width
         self.height = height
 
-class MockPage:
-    def __init__(self, number: int):
-        self.number = number
-
 @pytest.fixture
 def cache():
     return DocumentCache(max_size=2)
@@ -22,90 +18,140 @@ def test_cache_initialization(cache):
     assert cache.cache_info["pages"] == []
 
 def test_add_and_get_page_image(cache):
-    page = MockPage(0)
     image = MockPixmap()
-    
+
     # Initially not in cache
-    assert cache.get_page_image(page) is None
-    
+    assert cache.get_page_image(0) is None
+
     # Add to cache
-    cache.add_page_image(page, image)
-    
+    cache.add_page_image(0, image)
+
     # Should be in cache now
-    cached_image = cache.get_page_image(page)
+    cached_image = cache.get_page_image(0)
     assert cached_image == image
     assert cache.cache_info["size"] == 1
     assert cache.cache_info["pages"] == [0]
 
 def test_cache_eviction(cache):
     # Add three items to a cache with max_size=2
-    page1, page2, page3 = MockPage(0), MockPage(1), MockPage(2)
     image1, image2, image3 = MockPixmap(), MockPixmap(), MockPixmap()
-    
-    cache.add_page_image(page1, image1)
-    cache.add_page_image(page2, image2)
-    cache.add_page_image(page3, image3)
-    
+
+    cache.add_page_image(0, image1)
+    cache.add_page_image(1, image2)
+    cache.add_page_image(2, image3)
+
     # First item should be evicted
-    assert cache.get_page_image(page1) is None
-    assert cache.get_page_image(page2) == image2
-    assert cache.get_page_image(page3) == image3
+    assert cache.get_page_image(0) is None
+    assert cache.get_page_image(1) == image2
+    assert cache.get_page_image(2) == image3
     assert cache.cache_info["size"] == 2
     assert sorted(cache.cache_info["pages"]) == [1, 2]
 
 def test_cache_lru_behavior(cache):
-    page1, page2 = MockPage(0), MockPage(1)
     image1, image2 = MockPixmap(), MockPixmap()
-    
-    cache.add_page_image(page1, image1)
-    cache.add_page_image(page2, image2)
-    
-    # Access page1, making it most recently used
-    cache.get_page_image(page1)
-    
-    # Add new item, should evict page2
-    page3 = MockPage(2)
+
+    cache.add_page_image(0, image1)
+    cache.add_page_image(1, image2)
+
+    # Access page 0, making it most recently used
+    cache.get_page_image(0)
+
+    # Add new item, should evict page 1
     image3 = MockPixmap()
-    cache.add_page_image(page3, image3)
-    
-    assert cache.get_page_image(page1) == image1  # Still in cache
-    assert cache.get_page_image(page2) is None    # Evicted
-    assert cache.get_page_image(page3) == image3  # Added
+    cache.add_page_image(2, image3)
+
+    assert cache.get_page_image(0) == image1  # Still in cache
+    assert cache.get_page_image(1) is None    # Evicted
+    assert cache.get_page_image(2) == image3  # Added
     assert cache.cache_info["size"] == 2
     assert sorted(cache.cache_info["pages"]) == [0, 2]
 
 def test_clear_cache(cache):
-    page = MockPage(0)
     image = MockPixmap()
-    cache.add_page_image(page, image)
-    
+    cache.add_page_image(0, image)
+
     cache.clear()
-    assert cache.get_page_image(page) is None
+    assert cache.get_page_image(0) is None
     assert cache.cache_info["size"] == 0
     assert cache.cache_info["pages"] == []
 
 def test_remove_page(cache):
-    page1, page2 = MockPage(0), MockPage(1)
     image1, image2 = MockPixmap(), MockPixmap()
-    
-    cache.add_page_image(page1, image1)
-    cache.add_page_image(page1, image2, zoom=2.0)  # Different zoom level
-    
+
+    cache.add_page_image(0, image1)
+    cache.add_page_image(0, image2, zoom_key=200)  # Different zoom level
+
     cache.remove_page(0)
-    assert cache.get_page_image(page1) is None
-    assert cache.get_page_image(page1, zoom=2.0) is None
+    assert cache.get_page_image(0) is None
+    assert cache.get_page_image(0, zoom_key=200) is None
     assert cache.cache_info["size"] == 0
     assert cache.cache_info["pages"] == []
 
+def test_remove_pages():
+    cache = DocumentCache(max_size=4)
+    images = [MockPixmap() for _ in range(4)]
+    for page, image in enumerate(images):
+        cache.add_page_image(page, image)
+
+    cache.remove_pages({0, 2})
+    assert cache.get_page_image(0) is None
+    assert cache.get_page_image(1) == images[1]
+    assert cache.get_page_image(2) is None
+    assert cache.get_page_image(3) == images[3]
+    assert cache.cache_info["pages"] == [1, 3]
+
+def test_remap():
+    cache = DocumentCache(max_size=4)
+    images = [MockPixmap() for _ in range(3)]
+    for page, image in enumerate(images):
+        cache.add_page_image(page, image)
+
+    # Keep pages 2 and 0, in that order; page 1 is dropped
+    cache.remap({2: 0, 0: 1})
+    assert cache.get_page_image(0) == images[2]
+    assert cache.get_page_image(1) == images[0]
+    assert cache.get_page_image(2) is None
+    assert cache.cache_info["pages"] == [0, 1]
+
+def test_persistent_thumbnails(tmp_path):
+    cache = DocumentCache(max_size=2, persist_dir=str(tmp_path))
+    cache.set_document("/some/file.pdf", 123.0)
+    cache.add_page_image(0, b"jpeg-bytes", zoom_key=20)
+
+    # A fresh cache for the same document finds the persisted thumbnail
+    cache2 = DocumentCache(max_size=2, persist_dir=str(tmp_path))
+    cache2.set_document("/some/file.pdf", 123.0)
+    assert cache2.get_page_image(0, zoom_key=20) == b"jpeg-bytes"
+
+    # A different mtime invalidates the persisted entry
+    cache3 = DocumentCache(max_size=2, persist_dir=str(tmp_path))
+    cache3.set_document("/some/file.pdf", 456.0)
+    assert cache3.get_page_image(0, zoom_key=20) is None
+
+def test_mutation_detaches_persistence(tmp_path):
+    cache = DocumentCache(max_size=2, persist_dir=str(tmp_path))
+    cache.set_document("/some/file.pdf", 123.0)
+    cache.add_page_image(0, b"jpeg-bytes", zoom_key=20)
+
+    # A page mutation must stop the disk layer from serving rows keyed
+    # against the pre-edit page numbering
+    cache.remove_page(0)
+    assert cache.get_page_image(0, zoom_key=20) is None
+
+    # ...and from persisting post-edit thumbnails under the stale key
+    cache.add_page_image(0, b"new-bytes", zoom_key=20)
+    fresh = DocumentCache(max_size=2, persist_dir=str(tmp_path))
+    fresh.set_document("/some/file.pdf", 123.0)
+    assert fresh.get_page_image(0, zoom_key=20) == b"jpeg-bytes"
+
 def test_different_zoom_levels(cache):
-    page = MockPage(0)
     image1 = MockPixmap()
     image2 = MockPixmap(200, 200)  # Different size for different zoom
-    
-    cache.add_page_image(page, image1, zoom=1.0)
-    cache.add_page_image(page, image2, zoom=2.0)
-    
-    assert cache.get_page_image(page, zoom=1.0) == image1
-    assert cache.get_page_image(page, zoom=2.0) == image2
+
+    cache.add_page_image(0, image1, zoom_key=100)
+    cache.add_page_image(0, image2, zoom_key=200)
+
+    assert cache.get_page_image(0, zoom_key=100) == image1
+    assert cache.get_page_image(0, zoom_key=200) == image2
     assert cache.cache_info["size"] == 2
-    assert cache.cache_info["pages"] == [0]
\ No newline at end of file
+    assert cache.cache_info["pages"] == [0]
@@ -2,49 +2,109 @@ import pytest
 from src.models.pdf_document import PDFDocument
 from src.models.pdf_errors import PDFDocumentError, PDFPageError
 import fitz
-import os
 from typing import List
 
-# Fixture for creating a temporary PDF file
-@pytest.fixture
-def temp_pdf(tmp_path):
-    doc = fitz.open()
-    page = doc.new_page()
-    page.insert_text((50, 72), "Test Page", fontsize=12)
-    filepath = tmp_path / "test.pdf"
-    doc.save(str(filepath))
-    doc.close()
-    yield str(filepath)
-    if os.path.exists(str(filepath)):
-        os.remove(str(filepath))
-
-# Fixture for a PDF with multiple pages
-@pytest.fixture
-def multi_page_pdf(tmp_path):
-    doc = fitz.open()
-    for i in range(3):
-        page = doc.new_page()
-        page.insert_text((50, 72), f"Page {i+1}", fontsize=12)
-    filepath = tmp_path / "multi_page.pdf"
-    doc.save(str(filepath))
-    doc.close()
-    yield str(filepath)
-    if os.path.exists(str(filepath)):
-        os.remove(str(filepath))
+# The temp_pdf and multi_page_pdf fixtures are session-scoped and live
+# in conftest.py; documents load from the file into memory, so sharing
+# one master file per session is safe.
 
-def test_load_pdf(temp_pdf):
-    doc = PDFDocument(temp_pdf)
-    assert doc.doc is not None
-    assert doc.page_count == 1
-    assert doc.filepath == temp_pdf
-    doc.close()
+def all_texts(doc):
+    """Extract every page's text in one pass over the document.
 
-def test_save_pdf(temp_pdf, tmp_path):
-    doc = PDFDocument(temp_pdf)
+    Iterating the underlying fitz document keeps one loaded page per
+    step instead of re-resolving each index through get_page_text.
+    """
+    return [page.get_text() for page in doc.doc]
+
+# Class-scoped but defined at module level: fixtures declared inside a
+# class are deprecated (PytestRemovedIn10Warning)
+@pytest.fixture(scope="class")
+def doc(temp_pdf):
+    with PDFDocument(temp_pdf) as d:
+        yield d
+
+class TestReadOnlySinglePage:
+    """Read-only queries grouped over one shared document.
+
+    The class-scoped document parses the xref once; these tests only
+    query (text, search, metadata, rendering), so they cannot observe
+    each other through it.
+    """
+
+    def test_load_pdf(self, doc, temp_pdf):
+        assert doc.doc is not None
+        assert doc.page_count == 1
+        assert doc.filepath == temp_pdf
+
+    @pytest.mark.slow
+    def test_get_page_image_renders(self, doc):
+        pixmap = doc.get_page_image(0)
+        assert isinstance(pixmap, fitz.Pixmap)
+        assert pixmap.width > 0 and pixmap.height > 0
+
+    def test_get_page_image_thumbnail_zoom(self, doc):
+        pixmap = doc.get_page_image(0, zoom=0.2)
+        assert isinstance(pixmap, fitz.Pixmap)
+        # Cached compressed, but still decoded back to a pixmap on a hit
+        cached = doc.get_page_image(0, zoom=0.2)
+        assert isinstance(cached, fitz.Pixmap)
+        assert (cached.width, cached.height) == (pixmap.width, pixmap.height)
+
+    def test_metadata(self, doc):
+        metadata = doc.metadata
+        assert isinstance(metadata, dict)
+        assert "producer" in metadata
+
+    def test_get_page_text(self, doc):
+        text = doc.get_page_text(0)
+        assert "Test Page" in text
+
+    def test_get_page_text_html(self, doc):
+        text = doc.get_page_text(0, "html")
+        assert "<span" in text and "Test Page" in text
+
+    def test_get_page_text_invalid_page(self, doc):
+        text = doc.get_page_text(1)
+        assert text is None
+
+    def test_search_page_for(self, doc):
+        results: List[fitz.Rect] = doc.search_page_for(0, "Test")
+        assert len(results) == 1
+        assert isinstance(results[0], fitz.Rect)
+
+    def test_search_page_for_quads(self, doc):
+        results: List[fitz.Quad] = doc.search_page_for(0, "Test", quads=True)
+        assert len(results) == 1
+        assert isinstance(results[0], fitz.Quad)
+
+    def test_search_page_for_not_found(self, doc):
+        results = doc.search_page_for(0, "Nonexistent")
+        assert len(results) == 0
+
+    def test_search_page_for_invalid_page(self, doc):
+        results = doc.search_page_for(1, "Test")
+        assert isinstance(results, list)
+        assert len(results) == 0
+
+    def test_get_page_thumbnail(self, doc):
+        """Test that thumbnails render directly at target size."""
+        thumbnail = doc.get_page_thumbnail(0)
+        assert thumbnail is not None
+        assert thumbnail.width <= 120
+        assert thumbnail.height <= 160
+
+def test_save_pdf(pdf_doc, tmp_path):
+    doc = pdf_doc
     new_filepath = tmp_path / "new_test.pdf"
     doc.save(str(new_filepath))
-    assert new_filepath.exists()
-    doc.close()
+    # Magic-byte smoke check; the full reopen (xref parse) happens once,
+    # in the roundtrip test below
+    assert new_filepath.read_bytes()[:5] == b"%PDF-"
+
+def test_save_pdf_roundtrip_integrity(pdf_doc, tmp_path):
+    doc = pdf_doc
+    new_filepath = tmp_path / "roundtrip.pdf"
+    doc.save(str(new_filepath))
     doc2 = fitz.open(str(new_filepath))
     assert doc2.page_count == 1
     doc2.close()
@@ -60,62 +120,87 @@ def test_close_pdf(temp_pdf):
     assert doc.doc is None
     assert doc.filepath is None
 
-def test_delete_page(temp_pdf):
-    doc = PDFDocument(temp_pdf)
+def test_delete_page(pdf_doc):
+    doc = pdf_doc
     doc.delete_page(0)
     assert doc.page_count == 0
-    doc.close()
 
-def test_delete_page_invalid_index(temp_pdf):
-    doc = PDFDocument(temp_pdf)
+def test_delete_page_invalid_index(pdf_doc):
+    doc = pdf_doc
     with pytest.raises(PDFPageError, match="Page number out of range"):
         doc.delete_page(1)
-    doc.close()
 
-def test_delete_page_no_document_loaded():
-    doc = PDFDocument()
-    with pytest.raises(PDFDocumentError, match="Cannot delete_page: No document loaded"):
-        doc.delete_page(0)
-
-def test_get_page_image(temp_pdf):
-    doc = PDFDocument(temp_pdf)
+def test_get_page_image(pdf_doc, monkeypatch):
+    doc = pdf_doc
+    # Unit test of the call/cache path only; rasterization is stubbed out
+    # (it is by far the most expensive operation in this module) and
+    # covered once by the slow render test below
+    sentinel = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 1, 1))
+    monkeypatch.setattr(
+        fitz.DisplayList, "get_pixmap", lambda self, **kwargs: sentinel
+    )
     pixmap = doc.get_page_image(0)
-    assert pixmap is not None
-    assert isinstance(pixmap, fitz.Pixmap)
-    doc.close()
+    assert pixmap is sentinel
 
-def test_get_page_image_invalid_index(temp_pdf):
-    doc = PDFDocument(temp_pdf)
+def test_get_page_image_invalid_index(pdf_doc):
+    doc = pdf_doc
     pixmap = doc.get_page_image(1)
     assert pixmap is None
-    doc.close()
+
+def test_render_pages(multi_pdf_doc):
+    doc = multi_pdf_doc
+    pixmaps = doc.render_pages([0, 1, 2])
+    assert sorted(pixmaps.keys()) == [0, 1, 2]
+    assert all(isinstance(p, fitz.Pixmap) for p in pixmaps.values())
+
+def test_render_pages_after_edit(multi_pdf_doc):
+    doc = multi_pdf_doc
+    doc.select([2, 1, 0])
+    pixmaps = doc.render_pages([0])
+    # Must match an in-memory render of the edited page, not the file
+    reference = doc.doc.load_page(0).get_pixmap(
+        matrix=fitz.Matrix(1, 1), colorspace=fitz.csRGB, alpha=False
+    )
+    assert pixmaps[0].samples == reference.samples
+
+def test_render_pages_thumbnail_zoom(pdf_doc):
+    doc = pdf_doc
+    # Prime the cache with compressed thumbnail bytes, then hit it
+    doc.get_page_image(0, zoom=0.2)
+    pixmaps = doc.render_pages([0], zoom=0.2)
+    assert isinstance(pixmaps[0], fitz.Pixmap)
+
+def test_render_pages_invalid_index(multi_pdf_doc):
+    doc = multi_pdf_doc
+    with pytest.raises(PDFPageError, match="Page number out of range"):
+        doc.render_pages([0, 3])
+
+def test_prefetch(multi_pdf_doc):
+    doc = multi_pdf_doc
+    futures = doc.prefetch(1, radius=1)
+    for future in futures:
+        future.result()
+    # The neighborhood is now served straight from the cache
+    assert sorted(doc._cache.cache_info["pages"]) == [0, 1, 2]
 
 def test_load_nonexistent_pdf():
     with pytest.raises(PDFDocumentError):
         PDFDocument("nonexistent.pdf")
 
-def test_metadata(temp_pdf):
-    doc = PDFDocument(temp_pdf)
-    metadata = doc.metadata
-    assert isinstance(metadata, dict)
-    assert "producer" in metadata
-    doc.close()
-    
 def test_metadata_no_doc():
     doc = PDFDocument()
     metadata = doc.metadata
     assert isinstance(metadata, dict)
     assert len(metadata) == 0
 
-def test_toc(temp_pdf):
-    doc = PDFDocument(temp_pdf)
+def test_toc(pdf_doc):
+    doc = pdf_doc
     toc = doc.toc
     assert isinstance(toc, list)
     if doc.doc:
         doc.doc.set_toc([ [1, "Chapter 1", 1] ])
         toc = doc.toc
     assert len(toc) > 0 if doc.doc else len(toc) == 0
-    doc.close()
     
 def test_toc_no_doc():
     doc = PDFDocument()
@@ -123,115 +208,71 @@ def test_toc_no_doc():
     assert isinstance(toc, list)
     assert len(toc) == 0
 
-def test_delete_pages(multi_page_pdf):
-    doc = PDFDocument(multi_page_pdf)
+def test_delete_pages(multi_pdf_doc):
+    doc = multi_pdf_doc
     doc.delete_pages(1, 1)
     assert doc.page_count == 2
-    assert doc.get_page_text(0) == "Page 1\n"
-    assert doc.get_page_text(1) == "Page 3\n"
-    doc.close()
+    assert all_texts(doc) == ["Page 1\n", "Page 3\n"]
 
-def test_delete_pages_invalid_range(multi_page_pdf):
-    doc = PDFDocument(multi_page_pdf)
+def test_delete_pages_invalid_range(multi_pdf_doc):
+    doc = multi_pdf_doc
     with pytest.raises(PDFPageError, match="Page numbers out of range"):
         doc.delete_pages(1, 3)
     with pytest.raises(PDFPageError, match="Page numbers out of range"):
         doc.delete_pages(2, 1)
-    doc.close()
 
-def test_delete_pages_no_document_loaded():
-    doc = PDFDocument()
-    with pytest.raises(PDFDocumentError, match="Cannot delete_pages: No document loaded"):
-        doc.delete_pages(0, 1)
-
-def test_move_page(multi_page_pdf):
-    doc = PDFDocument(multi_page_pdf)
+def test_move_page(multi_pdf_doc):
+    doc = multi_pdf_doc
     doc.move_page(0, 2)  # Move page 0 to *before* index 2
     assert doc.page_count == 3
-    assert doc.get_page_text(0) == "Page 2\n"
-    assert doc.get_page_text(1) == "Page 1\n"
-    assert doc.get_page_text(2) == "Page 3\n"
-    doc.close()
+    assert all_texts(doc) == ["Page 2\n", "Page 1\n", "Page 3\n"]
 
-def test_move_page_invalid_index(multi_page_pdf):
-    doc = PDFDocument(multi_page_pdf)
+def test_move_page_invalid_index(multi_pdf_doc):
+    doc = multi_pdf_doc
     with pytest.raises(PDFPageError, match="Page number out of range"):
         doc.move_page(0, 3)
-    doc.close()
-
-def test_move_page_no_document_loaded():
-    doc = PDFDocument()
-    with pytest.raises(PDFDocumentError, match="Cannot move_page: No document loaded"):
-        doc.move_page(0, 1)
 
-def test_copy_page(multi_page_pdf):
-    doc = PDFDocument(multi_page_pdf)
+def test_copy_page(multi_pdf_doc):
+    doc = multi_pdf_doc
     doc.copy_page(0)  # copy to end
     assert doc.page_count == 4
-    assert doc.get_page_text(0) == "Page 1\n"
-    assert doc.get_page_text(3) == "Page 1\n"
-    doc.close()
+    assert all_texts(doc) == ["Page 1\n", "Page 2\n", "Page 3\n", "Page 1\n"]
 
-def test_copy_page_to_position(multi_page_pdf):
-    doc = PDFDocument(multi_page_pdf)
+def test_copy_page_to_position(multi_pdf_doc):
+    doc = multi_pdf_doc
     doc.copy_page(0, 1)  # copy to position
     assert doc.page_count == 4
-    assert doc.get_page_text(0) == "Page 1\n"
-    assert doc.get_page_text(1) == "Page 1\n"
-    assert doc.get_page_text(2) == "Page 2\n"
-    doc.close()
+    assert all_texts(doc) == ["Page 1\n", "Page 1\n", "Page 2\n", "Page 3\n"]
 
-def test_copy_page_invalid_index(multi_page_pdf):
-    doc = PDFDocument(multi_page_pdf)
+def test_copy_page_invalid_index(multi_pdf_doc):
+    doc = multi_pdf_doc
     with pytest.raises(PDFPageError, match="Page number out of range"):
         doc.copy_page(3)
-    doc.close()
 
-def test_copy_page_no_document_loaded():
-    doc = PDFDocument()
-    with pytest.raises(PDFDocumentError, match="Cannot copy_page: No document loaded"):
-        doc.copy_page(0)
-        
-def test_select(multi_page_pdf):
-    doc = PDFDocument(multi_page_pdf)
+def test_select(multi_pdf_doc):
+    doc = multi_pdf_doc
     doc.select([1, 0, 1])
     assert doc.page_count == 3
-    assert doc.get_page_text(0) == "Page 2\n"
-    assert doc.get_page_text(1) == "Page 1\n"
-    assert doc.get_page_text(2) == "Page 2\n"
-    doc.close()
+    assert all_texts(doc) == ["Page 2\n", "Page 1\n", "Page 2\n"]
 
-def test_select_invalid_page_list(multi_page_pdf):
-    doc = PDFDocument(multi_page_pdf)
+def test_select_invalid_page_list(multi_pdf_doc):
+    doc = multi_pdf_doc
     with pytest.raises(PDFPageError, match="Invalid page number"):
         doc.select([0, 3, 1])
-    doc.close()
-
-def test_select_no_document_loaded():
-    doc = PDFDocument()
-    with pytest.raises(PDFDocumentError, match="Cannot select: No document loaded"):
-        doc.select([0, 1])
 
-def test_new_page(temp_pdf):
-    doc = PDFDocument(temp_pdf)
+def test_new_page(pdf_doc):
+    doc = pdf_doc
     new_page = doc.new_page()
     assert doc.page_count == 2
     assert new_page is not None
     assert isinstance(new_page, fitz.Page)
-    doc.close()
     
-def test_new_page_with_dimensions(temp_pdf):
-    doc = PDFDocument(temp_pdf)
+def test_new_page_with_dimensions(pdf_doc):
+    doc = pdf_doc
     new_page = doc.new_page(pno=0, width=100, height=200)
     assert doc.page_count == 2
     assert new_page is not None
     assert isinstance(new_page, fitz.Page)
-    doc.close()
-
-def test_new_page_no_document_loaded():
-    doc = PDFDocument()
-    with pytest.raises(PDFDocumentError, match="Cannot new_page: No document loaded"):
-        doc.new_page()
 
 def test_context_manager(temp_pdf):
     with PDFDocument(temp_pdf) as doc:
@@ -241,88 +282,57 @@ def test_context_manager(temp_pdf):
     assert doc.doc is None
     assert doc.filepath is None
 
-def test_get_page_text(temp_pdf):
-    doc = PDFDocument(temp_pdf)
-    text = doc.get_page_text(0)
-    assert "Test Page" in text
-    doc.close()
-
-def test_get_page_text_html(temp_pdf):
-    doc = PDFDocument(temp_pdf)
-    text = doc.get_page_text(0, "html")
-    assert "<span" in text and "Test Page" in text
-    doc.close()
-
-def test_get_page_text_invalid_page(temp_pdf):
-    doc = PDFDocument(temp_pdf)
-    text = doc.get_page_text(1)
-    assert text is None
-    doc.close()
-
-def test_get_page_text_no_document_loaded():
-    doc = PDFDocument()
-    with pytest.raises(PDFDocumentError, match="Cannot get_page_text: No document loaded"):
-        doc.get_page_text(0)
-
-def test_search_page_for(temp_pdf):
-    doc = PDFDocument(temp_pdf)
-    results: List[fitz.Rect] = doc.search_page_for(0, "Test")
-    assert len(results) == 1
-    assert isinstance(results[0], fitz.Rect)
-    doc.close()
-
-def test_search_page_for_quads(temp_pdf):
-    doc = PDFDocument(temp_pdf)
-    results: List[fitz.Quad] = doc.search_page_for(0, "Test", quads=True)
-    assert len(results) == 1
-    assert isinstance(results[0], fitz.Quad)
-    doc.close()
-
-def test_search_page_for_not_found(temp_pdf):
-    doc = PDFDocument(temp_pdf)
-    results = doc.search_page_for(0, "Nonexistent")
-    assert len(results) == 0
-    doc.close()
-
-def test_search_page_for_invalid_page(temp_pdf):
-    doc = PDFDocument(temp_pdf)
-    results = doc.search_page_for(1, "Test")
-    assert isinstance(results, list)
-    assert len(results) == 0
-    doc.close()
-
-def test_search_page_for_no_document_loaded():
-    doc = PDFDocument()
-    with pytest.raises(PDFDocumentError, match="Cannot search_page_for: No document loaded"):
-        doc.search_page_for(0, "Test")
-
-def test_get_page_images(temp_pdf):
-    doc = PDFDocument(temp_pdf)
+def test_search_document(multi_pdf_doc):
+    doc = multi_pdf_doc
+    results = doc.search_document("Page")
+    assert results["pages"] == [0, 1, 2]
+    assert len(results["x0"]) == 3
+    assert all(x0 < x1 for x0, x1 in zip(results["x0"], results["x1"]))
+
+def test_search_document_after_edit(multi_pdf_doc):
+    doc = multi_pdf_doc
+    # Reverse the pages in memory; results must follow the edited order,
+    # not the untouched file on disk
+    doc.select([2, 1, 0])
+    results = doc.search_document("Page 3")
+    assert results["pages"] == [0]
+    assert doc.search_document("Page 1")["pages"] == [2]
+
+def test_search_document_not_found(multi_pdf_doc):
+    doc = multi_pdf_doc
+    results = doc.search_document("Nonexistent")
+    assert results["pages"] == []
+
+@pytest.mark.slow
+def test_get_page_images(pdf_doc):
+    doc = pdf_doc
     page = doc.doc.load_page(0)
     rect = fitz.Rect(0, 0, 100, 100)
-    page.insert_image(rect, filename="resources/icons/open.png")
+    # In-memory pixmap: no PNG decode and no dependency on the repo's
+    # resources/ directory being in the working directory
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 2, 2))
+    pix.clear_with(128)
+    page.insert_image(rect, pixmap=pix)
     
     images = doc.get_page_images(0)
     assert isinstance(images, list)
     assert len(images) > 0
-    doc.close()
 
-def test_get_page_images_invalid_page(temp_pdf):
-    doc = PDFDocument(temp_pdf)
+def test_get_page_images_invalid_page(pdf_doc):
+    doc = pdf_doc
     images = doc.get_page_images(1)
     assert len(images) == 0
-    doc.close()
 
-def test_get_page_images_no_document_loaded():
-    doc = PDFDocument()
-    with pytest.raises(PDFDocumentError, match="Cannot get_page_images: No document loaded"):
-        doc.get_page_images(0)
-
-def test_extract_image(temp_pdf):
-    doc = PDFDocument(temp_pdf)
+@pytest.mark.slow
+def test_extract_image(pdf_doc):
+    doc = pdf_doc
     page = doc.doc.load_page(0)
     rect = fitz.Rect(0, 0, 100, 100)
-    page.insert_image(rect, filename="resources/icons/open.png")
+    # In-memory pixmap: no PNG decode and no dependency on the repo's
+    # resources/ directory being in the working directory
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 2, 2))
+    pix.clear_with(128)
+    page.insert_image(rect, pixmap=pix)
     images = doc.get_page_images(0)
     if images:
         xref = images[0][0]
@@ -330,9 +340,35 @@ def test_extract_image(temp_pdf):
         assert isinstance(image_data, dict)
         assert "ext" in image_data
         assert "image" in image_data
-    doc.close()
 
-def test_extract_image_no_document_loaded():
+# The "no document loaded" guard is identical across the API: one
+# parametrized test covers every guarded method instead of thirteen
+# near-identical test functions, each with its own setup/teardown
+@pytest.mark.parametrize("method,args", [
+    ("delete_page", (0,)),
+    ("render_pages", ([0],)),
+    ("prefetch", (0,)),
+    ("delete_pages", (0, 1)),
+    ("move_page", (0, 1)),
+    ("copy_page", (0,)),
+    ("select", ([0, 1],)),
+    ("new_page", ()),
+    ("get_page_text", (0,)),
+    ("search_page_for", (0, "Test")),
+    ("search_document", ("Test",)),
+    ("get_page_images", (0,)),
+    ("extract_image", (1,)),
+])
+def test_no_document_loaded(method, args):
     doc = PDFDocument()
-    with pytest.raises(PDFDocumentError, match="Cannot extract_image: No document loaded"):
-        doc.extract_image(1)
\ No newline at end of file
+    with pytest.raises(
+        PDFDocumentError, match=f"Cannot {method}: No document loaded"
+    ):
+        getattr(doc, method)(*args)
+
+def test_get_page_thumbnail_no_document_loaded(temp_pdf):
+    """Test that get_page_thumbnail raises without a loaded document."""
+    doc = PDFDocument(temp_pdf)
+    doc.close()
+    with pytest.raises(PDFDocumentError):
+        doc.get_page_thumbnail(0)
@@ -0,0 +1,68 @@
+import pytest
+from PySide6.QtCore import Qt, QPoint, QPointF
+from PySide6.QtGui import QImage, QWheelEvent
+from src.views.pdf_viewer import PDFViewerWidget
+from src.views.thumbnail_panel import PDFThumbnailPanel
+from src.views.toolbar import PDFToolBar
+
+# Widget construction runs Qt layout, style resolution, and icon loading
+# every time. Each module shares one instance that the function-scoped
+# fixtures below reset between tests, which is far cheaper than building
+# a fresh widget per test.
+
+@pytest.fixture(scope="module")
+def _viewer_pool(qapp):
+    return PDFViewerWidget()
+
+@pytest.fixture
+def viewer(_viewer_pool):
+    _viewer_pool.clear()
+    _viewer_pool.set_zoom(1.0)
+    return _viewer_pool
+
+@pytest.fixture(scope="module")
+def _thumbnail_panel_pool(qapp):
+    return PDFThumbnailPanel()
+
+@pytest.fixture
+def thumbnail_panel(_thumbnail_panel_pool):
+    _thumbnail_panel_pool.clear()
+    _thumbnail_panel_pool.setVisible(True)
+    return _thumbnail_panel_pool
+
+@pytest.fixture(scope="session")
+def small_qimage(qapp):
+    """A 100x100 black QImage shared by display tests (never mutated)."""
+    img = QImage(100, 100, QImage.Format_RGB888)
+    img.fill(Qt.black)
+    return img
+
+@pytest.fixture
+def wheel_event_factory(qapp):
+    """Build synthesized wheel events with overridable delta/modifier."""
+
+    def make(dy=120, ctrl=True):
+        return QWheelEvent(
+            QPointF(50, 50),  # pos
+            QPointF(50, 50),  # global pos
+            QPoint(0, 0),     # pixelDelta
+            QPoint(0, dy),    # angleDelta
+            Qt.MouseButton.NoButton,
+            Qt.KeyboardModifier.ControlModifier if ctrl
+            else Qt.KeyboardModifier.NoModifier,
+            Qt.ScrollPhase.NoScrollPhase,
+            False,            # inverted
+            Qt.MouseEventSource.MouseEventNotSynthesized,
+        )
+
+    return make
+
+@pytest.fixture(scope="module")
+def _toolbar_pool(qapp):
+    return PDFToolBar()
+
+@pytest.fixture
+def toolbar(_toolbar_pool):
+    _toolbar_pool.update_actions(False)
+    _toolbar_pool.update_page_info(0, 1)
+    return _toolbar_pool
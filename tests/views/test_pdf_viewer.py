@@ -1,28 +1,23 @@
 import pytest
-from PySide6.QtCore import Qt, QPoint, QPointF
-from PySide6.QtGui import QImage, QWheelEvent
 from src.views.pdf_viewer import PDFViewerWidget, PDFPageLabel
 
-def test_initial_state(qapp):
+def test_initial_state(viewer):
     """Test initial viewer state."""
-    viewer = PDFViewerWidget()
     assert viewer.current_page == 0
     assert viewer.total_pages == 0
     assert viewer.zoom_level == 1.0
     assert len(viewer.page_labels) == 0
 
-def test_zoom_limits(qapp):
+def test_zoom_limits(viewer):
     """Test zoom level limits."""
-    viewer = PDFViewerWidget()
     viewer.set_zoom(0.05)  # Below minimum
     assert viewer.zoom_level == 0.1  # Should be clamped to minimum
     
     viewer.set_zoom(6.0)  # Above maximum
     assert viewer.zoom_level == 5.0  # Should be clamped to maximum
 
-def test_set_document(qapp):
+def test_set_document(viewer):
     """Test document initialization."""
-    viewer = PDFViewerWidget()
     
     # Track signals
     pages_changed = []
@@ -36,9 +31,8 @@ def test_set_document(qapp):
     assert all(isinstance(label, PDFPageLabel) for label in viewer.page_labels)
     assert pages_changed == [0]  # Should emit initial page
 
-def test_page_navigation(qapp):
+def test_page_navigation(viewer):
     """Test page navigation."""
-    viewer = PDFViewerWidget()
     viewer.set_document(5)
     
     # Track emitted signals
@@ -54,9 +48,8 @@ def test_page_navigation(qapp):
     assert viewer.current_page == 2  # Should not change
     assert len(received_pages) == 1  # No new signal
 
-def test_zoom_operations(qapp):
+def test_zoom_operations(viewer):
     """Test zoom operations."""
-    viewer = PDFViewerWidget()
     initial_zoom = viewer.zoom_level
     
     viewer.zoom_in()
@@ -68,21 +61,15 @@ def test_zoom_operations(qapp):
     viewer.reset_zoom()
     assert viewer.zoom_level == 1.0
 
-def test_page_display(qapp):
+def test_page_display(viewer, small_qimage):
     """Test page display."""
-    viewer = PDFViewerWidget()
-    # Create test image
-    img = QImage(100, 100, QImage.Format_RGB888)
-    img.fill(Qt.black)
-    
     viewer.set_document(1)
-    viewer.display_page(0, img)
+    viewer.display_page(0, small_qimage)
     
     assert viewer.page_labels[0].pixmap() is not None
 
-def test_clear(qapp):
+def test_clear(viewer):
     """Test clearing the viewer."""
-    viewer = PDFViewerWidget()
     viewer.set_document(3)
     viewer.clear()
     
@@ -90,31 +77,19 @@ def test_clear(qapp):
     assert viewer.current_page == 0
     assert len(viewer.page_labels) == 0
 
-def test_wheel_zoom(qapp):
-    """Test zooming with mouse wheel."""
-    viewer = PDFViewerWidget()
+@pytest.mark.parametrize("dy", [120, -120], ids=["zoom-in", "zoom-out"])
+def test_wheel_zoom(viewer, wheel_event_factory, dy):
+    """Test zooming with the mouse wheel in both directions."""
     initial_zoom = viewer.zoom_level
-    
-    # Create wheel event with Ctrl modifier
-    event = QWheelEvent(
-        QPointF(50, 50),  # pos
-        QPointF(50, 50),  # global pos
-        QPoint(0, 0),     # pixelDelta
-        QPoint(0, 120),   # angleDelta
-        Qt.MouseButton.NoButton,  # buttons
-        Qt.KeyboardModifier.ControlModifier,  # modifiers
-        Qt.ScrollPhase.NoScrollPhase,  # phase
-        False,            # inverted
-        Qt.MouseEventSource.MouseEventNotSynthesized  # source
-    )
-    
-    # Process the event
-    viewer.wheelEvent(event)
-    assert viewer.zoom_level > initial_zoom
 
-def test_scroll_page_tracking(qapp):
+    viewer.wheelEvent(wheel_event_factory(dy=dy))
+    if dy > 0:
+        assert viewer.zoom_level > initial_zoom
+    else:
+        assert viewer.zoom_level < initial_zoom
+
+def test_scroll_page_tracking(viewer):
     """Test page tracking during scrolling."""
-    viewer = PDFViewerWidget()
     viewer.set_document(3)
     
     # Track page change signals
@@ -2,25 +2,36 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import QListWidgetItem
 from src.views.thumbnail_panel import PDFThumbnailPanel
+import pytest
 
-def create_test_image():
-    """Create a test image for thumbnails."""
+# The panel only reads the pixmaps it is handed (they are scaled into new
+# icons), so one shared instance per module replaces a fresh allocation
+# and QImage->QPixmap conversion in every test.
+
+@pytest.fixture(scope="module")
+def small_pixmap(qapp):
     img = QImage(100, 100, QImage.Format_RGB888)
     img.fill(Qt.black)
     return QPixmap.fromImage(img)
 
-def test_initial_state(qapp):
+@pytest.fixture(scope="module")
+def large_pixmap(qapp):
+    img = QImage(1000, 1000, QImage.Format_RGB888)
+    img.fill(Qt.black)
+    return QPixmap.fromImage(img)
+
+def test_initial_state(thumbnail_panel):
     """Test initial panel state."""
-    panel = PDFThumbnailPanel()
+    panel = thumbnail_panel
     assert panel.list_widget.count() == 0
     assert panel.isVisible()
     assert panel.list_widget.iconSize().width() <= 120
     assert panel.list_widget.iconSize().height() <= 160
 
-def test_add_thumbnail(qapp):
+def test_add_thumbnail(thumbnail_panel, small_pixmap):
     """Test adding thumbnails."""
-    panel = PDFThumbnailPanel()
-    pixmap = create_test_image()
+    panel = thumbnail_panel
+    pixmap = small_pixmap
     panel.add_thumbnail(pixmap, 0)
     
     assert panel.list_widget.count() == 1
@@ -29,20 +40,20 @@ def test_add_thumbnail(qapp):
     assert item.text() == "Page 1"  # 1-based page numbers in display
     assert not item.icon().isNull()
 
-def test_clear(qapp):
+def test_clear(thumbnail_panel, small_pixmap):
     """Test clearing thumbnails."""
-    panel = PDFThumbnailPanel()
-    pixmap = create_test_image()
+    panel = thumbnail_panel
+    pixmap = small_pixmap
     panel.add_thumbnail(pixmap, 0)
     panel.add_thumbnail(pixmap, 1)
     
     panel.clear()
     assert panel.list_widget.count() == 0
 
-def test_select_page(qapp):
+def test_select_page(thumbnail_panel, small_pixmap):
     """Test page selection."""
-    panel = PDFThumbnailPanel()
-    pixmap = create_test_image()
+    panel = thumbnail_panel
+    pixmap = small_pixmap
     panel.add_thumbnail(pixmap, 0)
     panel.add_thumbnail(pixmap, 1)
     
@@ -53,10 +64,10 @@ def test_select_page(qapp):
     panel.select_page(5)  # Beyond range
     assert panel.list_widget.currentRow() == 1  # Should not change
 
-def test_thumbnail_click(qapp, qtbot):
+def test_thumbnail_click(thumbnail_panel, qtbot, small_pixmap):
     """Test thumbnail click signal."""
-    panel = PDFThumbnailPanel()
-    pixmap = create_test_image()
+    panel = thumbnail_panel
+    pixmap = small_pixmap
     panel.add_thumbnail(pixmap, 0)
     
     # Connect test slot
@@ -70,19 +81,19 @@ def test_thumbnail_click(qapp, qtbot):
     assert len(received_signals) == 1
     assert received_signals[0] == 0  # Should emit 0-based page number
 
-def test_visibility_toggle(qapp):
+def test_visibility_toggle(thumbnail_panel):
     """Test panel visibility toggle."""
-    panel = PDFThumbnailPanel()
+    panel = thumbnail_panel
     assert panel.isVisible()
     panel.setVisible(False)
     assert not panel.isVisible()
     panel.setVisible(True)
     assert panel.isVisible()
 
-def test_multiple_thumbnails(qapp):
+def test_multiple_thumbnails(thumbnail_panel, small_pixmap):
     """Test adding multiple thumbnails."""
-    panel = PDFThumbnailPanel()
-    pixmap = create_test_image()
+    panel = thumbnail_panel
+    pixmap = small_pixmap
     num_pages = 5
     
     for i in range(num_pages):
@@ -94,12 +105,11 @@ def test_multiple_thumbnails(qapp):
         assert item.text() == f"Page {i + 1}"
         assert not item.icon().isNull()
 
-def test_thumbnail_size_constraints(qapp):
+@pytest.mark.slow
+def test_thumbnail_size_constraints(thumbnail_panel, large_pixmap):
     """Test thumbnail size constraints."""
-    panel = PDFThumbnailPanel()
-    large_image = QImage(1000, 1000, QImage.Format_RGB888)
-    large_image.fill(Qt.black)
-    panel.add_thumbnail(QPixmap.fromImage(large_image), 0)
+    panel = thumbnail_panel
+    panel.add_thumbnail(large_pixmap, 0)
     
     item = panel.list_widget.item(0)
     icon = item.icon()
@@ -108,9 +118,9 @@ def test_thumbnail_size_constraints(qapp):
     assert actual_size.width() <= 120
     assert actual_size.height() <= 160
 
-def test_panel_style(qapp):
+def test_panel_style(thumbnail_panel):
     """Test panel styling."""
-    panel = PDFThumbnailPanel()
+    panel = thumbnail_panel
     style = panel.list_widget.styleSheet()
     
     # Check essential style properties
@@ -1,8 +1,7 @@
 from src.views.toolbar import PDFToolBar
 
-def test_initial_state(qapp):
+def test_initial_state(toolbar):
     """Test initial toolbar state."""
-    toolbar = PDFToolBar()
     
     # Test basic properties
     assert not toolbar.isMovable()
@@ -25,9 +24,8 @@ def test_initial_state(qapp):
     assert not toolbar.nextPageAction.isEnabled()
     assert not toolbar.pageSpinBox.isEnabled()
 
-def test_action_enable_disable(qapp):
+def test_action_enable_disable(toolbar):
     """Test enabling and disabling actions."""
-    toolbar = PDFToolBar()
     
     toolbar.update_actions(True)  # Document loaded
     assert all(action.isEnabled() for action in [
@@ -53,9 +51,8 @@ def test_action_enable_disable(qapp):
         toolbar.pageSpinBox
     ])
 
-def test_page_navigation_updates(qapp):
+def test_page_navigation_updates(toolbar):
     """Test page navigation control updates."""
-    toolbar = PDFToolBar()
     toolbar.update_actions(True)  # Enable controls
     
     # Test first page
@@ -78,9 +75,8 @@ def test_page_navigation_updates(qapp):
     assert toolbar.previousPageAction.isEnabled()  # Has previous page
     assert not toolbar.nextPageAction.isEnabled()  # No next page
 
-def test_page_spinbox_signals(qapp):
+def test_page_spinbox_signals(toolbar):
     """Test page spinbox signals."""
-    toolbar = PDFToolBar()
     toolbar.update_actions(True)
     toolbar.update_page_info(0, 5)  # Set up 5 pages
     
@@ -93,9 +89,8 @@ def test_page_spinbox_signals(qapp):
     assert len(received_pages) == 1
     assert received_pages[0] == 2  # Convert to 0-based index
 
-def test_navigation_button_signals(qapp):
+def test_navigation_button_signals(toolbar):
     """Test navigation button signals."""
-    toolbar = PDFToolBar()
     toolbar.update_actions(True)
     toolbar.update_page_info(1, 5)  # Start at page 2 of 5
     
@@ -113,9 +108,8 @@ def test_navigation_button_signals(qapp):
     
     assert signals_received == ["previous", "next"]
 
-def test_zoom_button_signals(qapp):
+def test_zoom_button_signals(toolbar):
     """Test zoom button signals."""
-    toolbar = PDFToolBar()
     toolbar.update_actions(True)
     
     # Track emitted signals
@@ -136,9 +130,8 @@ def test_zoom_button_signals(qapp):
     
     assert signals_received == ["zoom_in", "zoom_out", "zoom_reset"]
 
-def test_file_operation_signals(qapp):
+def test_file_operation_signals(toolbar):
     """Test file operation signals."""
-    toolbar = PDFToolBar()
     toolbar.update_actions(True)
     
     # Track emitted signals
@@ -159,9 +152,8 @@ def test_file_operation_signals(qapp):
     
     assert signals_received == ["open", "save", "save_as"]
 
-def test_style_properties(qapp):
+def test_style_properties(toolbar):
     """Test toolbar styling."""
-    toolbar = PDFToolBar()
     
     # Test spinbox style properties
     spinbox_style = toolbar.pageSpinBox.styleSheet()